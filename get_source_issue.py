@@ -2,6 +2,9 @@ import requests
 import json
 import os
 import base64
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # 從 jira_config.json 讀取設定
 CONFIG_FILE = "jira_config.json"
@@ -83,6 +86,18 @@ elif auth_type == "Bearer":
     domain = None  # Bearer Auth 不需要 domain
     email = None   # Bearer Auth 不需要 email
 
+# 共用的 HTTP Session：重複使用 TCP/TLS 連線，並對 429/5xx 自動重試
+# （重試用盡後回傳最後的回應，交給既有的狀態碼錯誤處理，而不是拋出 RetryError）
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
+# 認證標頭只依賴固定的設定值，快取結果避免每次請求重新做 base64 編碼（呼叫端不可修改回傳的 dict）
+@lru_cache(maxsize=4)
 def get_auth_headers(auth_type, api_token, email=None):
     """根據 authType 生成對應的認證標頭"""
     if auth_type == "Basic":
@@ -111,7 +126,7 @@ def test_authentication(base_url, auth_type, api_token, email=None):
 
     print("正在測試認證...")
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
 
         if response.status_code == 200:
             user_info = response.json()
@@ -145,7 +160,7 @@ def check_project_exists(base_url, project_key, auth_type, api_token, email=None
 
     print(f"正在檢查專案 {project_key} 是否存在...")
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
 
         if response.status_code == 200:
             project_data = response.json()
@@ -170,26 +185,6 @@ def check_project_exists(base_url, project_key, auth_type, api_token, email=None
         print(f"[錯誤] 檢查專案時發生錯誤: {str(e)}")
         return False
 
-def get_issue_details(base_url, issue_key, auth_type, api_token, email=None):
-    """取得單個 Issue 的詳細資訊（包含 description、comments 和 attachments）"""
-    url = f"{base_url}/issue/{issue_key}"
-    headers = get_auth_headers(auth_type, api_token, email)
-
-    params = {
-        "fields": "description,comment,attachment"
-    }
-
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"  警告: 無法取得 {issue_key} 的詳細資訊 (Status {response.status_code})")
-            return None
-    except Exception as e:
-        print(f"  警告: 取得 {issue_key} 詳細資訊時發生錯誤: {str(e)}")
-        return None
-
 def download_attachment(base_url, attachment, issue_key, auth_type, api_token, email=None):
     """下載單個附件"""
     attachment_id = attachment.get('id')
@@ -222,7 +217,7 @@ def download_attachment(base_url, attachment, issue_key, auth_type, api_token, e
     
     try:
         headers = get_auth_headers(auth_type, api_token, email)
-        response = requests.get(content_url, headers=headers, stream=True)
+        response = SESSION.get(content_url, headers=headers, stream=True)
         
         if response.status_code == 200:
             with open(file_path, 'wb') as f:
@@ -270,7 +265,7 @@ def get_issue_by_key(base_url, issue_key, auth_type, api_token, email=None):
         params = {
             "fields": "*all"  # 獲取所有字段，包括 custom field
         }
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.get(url, headers=headers, params=params)
 
         if response.status_code == 200:
             issue = response.json()
@@ -295,35 +290,10 @@ def get_all_issues(base_url, project_key, auth_type, api_token, email=None, max_
     issue_key = f"{project_key}-27940"
     all_issues, total = get_issue_by_key(base_url, issue_key, auth_type, api_token, email)
 
-    # 為每個 issue 補充 description、comments 和 attachments 資訊
-    if total > 0:
-        print(f"\n正在取得 {total} 個 Issue 的詳細資訊（description、comments 和 attachments）...")
-        for i, issue in enumerate(all_issues, 1):
-            issue_key = issue.get('key')
-            print(f"  處理中 ({i}/{total}): {issue_key}...")
-
-            details = get_issue_details(base_url, issue_key, auth_type, api_token, email)
-            if details and 'fields' in details:
-                if 'fields' not in issue:
-                    issue['fields'] = {}
-
-                # 補充 description 資訊
-                if 'description' in details['fields']:
-                    issue['fields']['description'] = details['fields']['description']
-
-                # 補充 comments 資訊
-                if 'comment' in details['fields']:
-                    issue['fields']['comment'] = details['fields']['comment']
-
-                # 補充 attachments 資訊
-                if 'attachment' in details['fields']:
-                    issue['fields']['attachment'] = details['fields']['attachment']
-                    
-                    # 下載附件
-                    if issue['fields']['attachment']:
-                        download_issue_attachments(base_url, issue, auth_type, api_token, email)
-
-        print(f"  完成！已取得所有 Issue 的詳細資訊。{' ' * 50}")
+    # description、comment、attachment 已包含在 *all 字段中，不需再逐一查詢，直接下載附件
+    for issue in all_issues:
+        if issue.get('fields', {}).get('attachment'):
+            download_issue_attachments(base_url, issue, auth_type, api_token, email)
 
     return all_issues, total
 
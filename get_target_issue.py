@@ -2,6 +2,9 @@ import requests
 import json
 import os
 import base64
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # 從 jira_config.json 讀取設定
 CONFIG_FILE = "jira_config.json"
@@ -100,6 +103,18 @@ elif auth_type == "Bearer":
     domain = None  # Bearer Auth 不需要 domain
     email = None   # Bearer Auth 不需要 email
 
+# 共用的 HTTP Session：重複使用 TCP/TLS 連線，並對 429/5xx 自動重試
+# （重試用盡後回傳最後的回應，交給既有的狀態碼錯誤處理，而不是拋出 RetryError）
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
+# 認證標頭只依賴固定的設定值，快取結果避免每次請求重新做 base64 編碼（呼叫端不可修改回傳的 dict）
+@lru_cache(maxsize=4)
 def get_auth_headers(auth_type, api_token, email=None):
     """根據 authType 生成對應的認證標頭"""
     if auth_type == "Basic":
@@ -128,7 +143,7 @@ def test_authentication(base_url, auth_type, api_token, email=None):
 
     print("正在測試認證...")
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
 
         if response.status_code == 200:
             user_info = response.json()
@@ -162,7 +177,7 @@ def check_project_exists(base_url, project_key, auth_type, api_token, email=None
 
     print(f"正在檢查專案 {project_key} 是否存在...")
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
 
         if response.status_code == 200:
             project_data = response.json()
@@ -187,26 +202,6 @@ def check_project_exists(base_url, project_key, auth_type, api_token, email=None
         print(f"[錯誤] 檢查專案時發生錯誤: {str(e)}")
         return False
 
-def get_issue_details(base_url, issue_key, auth_type, api_token, email=None):
-    """取得單個 Issue 的詳細資訊（包含 description、comments 和 attachments）"""
-    url = f"{base_url}/issue/{issue_key}"
-    headers = get_auth_headers(auth_type, api_token, email)
-
-    params = {
-        "fields": "description,comment,attachment"
-    }
-
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"  警告: 無法取得 {issue_key} 的詳細資訊 (Status {response.status_code})")
-            return None
-    except Exception as e:
-        print(f"  警告: 取得 {issue_key} 詳細資訊時發生錯誤: {str(e)}")
-        return None
-
 def get_single_issue_full_details(base_url, issue_key, auth_type, api_token, email=None):
     """取得單個 Issue 的完整詳細資訊（包含所有字段）"""
     url = f"{base_url}/issue/{issue_key}"
@@ -217,7 +212,7 @@ def get_single_issue_full_details(base_url, issue_key, auth_type, api_token, ema
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.get(url, headers=headers, params=params)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -240,7 +235,7 @@ def get_issue_editmeta(base_url, issue_key, auth_type, api_token, email=None):
     headers = get_auth_headers(auth_type, api_token, email)
 
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         if response.status_code == 200:
             return response.json()
         elif response.status_code == 404:
@@ -359,32 +354,34 @@ def display_single_issue_info(base_url, issue_key, auth_type, api_token, email=N
         else:
             system_fields[field_id] = metadata
     
-    print(f"\n系統字段 (共 {len(system_fields)} 個):")
-    print("-" * 80)
+    # 先收集所有輸出行再一次印出，避免每行一次 write（字段很多時終端輸出很慢）
+    lines = []
+    lines.append(f"\n系統字段 (共 {len(system_fields)} 個):")
+    lines.append("-" * 80)
     for field_id, metadata in sorted(system_fields.items()):
         required_mark = " [必填]" if metadata.get('required', False) else ""
-        print(f"  • {field_id}")
-        print(f"    名稱: {metadata.get('name', 'N/A')}")
-        print(f"    類型: {metadata.get('fieldType', metadata.get('type', 'N/A'))}")
-        print(f"    必填: {'是' if metadata.get('required', False) else '否'}{required_mark}")
+        lines.append(f"  • {field_id}")
+        lines.append(f"    名稱: {metadata.get('name', 'N/A')}")
+        lines.append(f"    類型: {metadata.get('fieldType', metadata.get('type', 'N/A'))}")
+        lines.append(f"    必填: {'是' if metadata.get('required', False) else '否'}{required_mark}")
         if metadata.get('operations'):
-            print(f"    可執行操作: {', '.join(metadata.get('operations', []))}")
-        print()
+            lines.append(f"    可執行操作: {', '.join(metadata.get('operations', []))}")
+        lines.append("")
     
-    print(f"\n自定義字段 (共 {len(custom_fields)} 個):")
-    print("-" * 80)
+    lines.append(f"\n自定義字段 (共 {len(custom_fields)} 個):")
+    lines.append("-" * 80)
     for field_id, metadata in sorted(custom_fields.items()):
         required_mark = " [必填]" if metadata.get('required', False) else ""
-        print(f"  • {field_id}")
-        print(f"    名稱: {metadata.get('name', 'N/A')}")
-        print(f"    類型: {metadata.get('fieldType', metadata.get('type', 'N/A'))}")
-        print(f"    數據類型: {metadata.get('type', 'N/A')}")
-        print(f"    必填: {'是' if metadata.get('required', False) else '否'}{required_mark}")
+        lines.append(f"  • {field_id}")
+        lines.append(f"    名稱: {metadata.get('name', 'N/A')}")
+        lines.append(f"    類型: {metadata.get('fieldType', metadata.get('type', 'N/A'))}")
+        lines.append(f"    數據類型: {metadata.get('type', 'N/A')}")
+        lines.append(f"    必填: {'是' if metadata.get('required', False) else '否'}{required_mark}")
         if metadata.get('customId'):
-            print(f"    自定義字段 ID: {metadata.get('customId')}")
+            lines.append(f"    自定義字段 ID: {metadata.get('customId')}")
         if metadata.get('allowedValues') is not None:
             allowed_count = len(metadata.get('allowedValues', []))
-            print(f"    允許的值數量: {allowed_count}")
+            lines.append(f"    允許的值數量: {allowed_count}")
             if allowed_count > 0 and allowed_count <= 10:
                 # 顯示前幾個允許的值
                 values = metadata.get('allowedValues', [])[:5]
@@ -394,10 +391,11 @@ def display_single_issue_info(base_url, issue_key, auth_type, api_token, email=N
                         value_names.append(val.get('value', val.get('name', str(val))))
                     else:
                         value_names.append(str(val))
-                print(f"    允許的值範例: {', '.join(value_names)}")
+                lines.append(f"    允許的值範例: {', '.join(value_names)}")
         if metadata.get('operations'):
-            print(f"    可執行操作: {', '.join(metadata.get('operations', []))}")
-        print()
+            lines.append(f"    可執行操作: {', '.join(metadata.get('operations', []))}")
+        lines.append("")
+    print("\n".join(lines))
     
     # 4. 顯示 Issue 的完整數據（包含所有字段值）
     print("\n[4] Issue 完整數據（包含所有字段值）")
@@ -464,7 +462,7 @@ def get_all_issues(base_url, project_key, auth_type, api_token, email=None, max_
             "fields": "*all"  # 獲取所有字段，包括 custom field
         }
 
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.get(url, headers=headers, params=params)
 
         if response.status_code != 200:
             print(f"取得 Issue 清單失敗 (Status {response.status_code}): {response.text}")
@@ -472,8 +470,9 @@ def get_all_issues(base_url, project_key, auth_type, api_token, email=None, max_
 
         data = response.json()
 
-        # 只在第一次請求時打印完整的數據結構
-        if start_at == 0:
+        # 只在第一次請求且設定 JIRA_DEBUG_FIRST_PAGE 環境變數時打印完整的數據結構
+        # （序列化整頁 JSON 到 stdout 成本很高，僅供除錯使用）
+        if start_at == 0 and os.getenv("JIRA_DEBUG_FIRST_PAGE"):
             print("\n" + "=" * 80)
             print("API 回應數據結構與內容:")
             print("=" * 80)
@@ -543,31 +542,7 @@ def get_all_issues(base_url, project_key, auth_type, api_token, email=None, max_
         all_issues = type_filtered_issues
     total = len(all_issues)
 
-    # 為每個 issue 補充 description、comments 和 attachments 資訊
-    if total > 0:
-        print(f"\n正在取得 {total} 個 Issue 的詳細資訊（description、comments 和 attachments）...")
-        for i, issue in enumerate(all_issues, 1):
-            issue_key = issue.get('key')
-            print(f"  處理中 ({i}/{total}): {issue_key}...", end='\r')
-
-            details = get_issue_details(base_url, issue_key, auth_type, api_token, email)
-            if details and 'fields' in details:
-                if 'fields' not in issue:
-                    issue['fields'] = {}
-
-                # 補充 description 資訊
-                if 'description' in details['fields']:
-                    issue['fields']['description'] = details['fields']['description']
-
-                # 補充 comments 資訊
-                if 'comment' in details['fields']:
-                    issue['fields']['comment'] = details['fields']['comment']
-
-                # 補充 attachments 資訊
-                if 'attachment' in details['fields']:
-                    issue['fields']['attachment'] = details['fields']['attachment']
-
-        print(f"  完成！已取得所有 Issue 的詳細資訊。{' ' * 50}")
+    # description、comment、attachment 已包含在 search 回應的 *all 字段中，不需再逐一查詢
 
     return all_issues, total
 
@@ -1,6 +1,7 @@
 import requests
 import webbrowser
 import json
+import time
 from flask import Flask, request
 
 # ================= 設定區 =================
@@ -73,7 +74,10 @@ def callback():
         "client_secret": CLIENT_SECRET,
         "cloud_id": cloud_id,
         "site_name": site_name,
-        "refresh_token": refresh_token # 關鍵：我們只存 Refresh Token 即可，Access Token 會過期
+        "refresh_token": refresh_token, # 關鍵：Refresh Token 用於換取新的 Access Token
+        # Access Token 會過期，記錄到期時間（預留 5 分鐘緩衝），到期前 main_script.py 可直接使用
+        "access_token": access_token,
+        "expires_at": time.time() + tokens.get("expires_in", 3600) - 300
     }
 
     with open("jira_config.json", "w") as f:
@@ -6,12 +6,66 @@ import requests
 import json
 import os
 import base64
-import re
-from typing import Set, Dict, List
+import hashlib
+import time
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
+from typing import Set, Dict, List, Iterator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration file path
 CONFIG_FILE = "jira_config.json"
 
+# On-disk memoization of API results for development re-runs (enable with MEMO_JSON=on,
+# clear by deleting the directory)
+MEMO_DIR = ".memo"
+
+def memo_json(ttl: int = 3600):
+    """Cache a function's JSON-serializable result under MEMO_DIR for ttl seconds"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if os.getenv("MEMO_JSON", "off").lower() != "on":
+                return func(*args, **kwargs)
+            
+            key_source = json.dumps([args, kwargs], sort_keys=True, default=str)
+            key = hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+            path = os.path.join(MEMO_DIR, f"{func.__name__}_{key}.json")
+            
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, "r", encoding="utf-8") as f:
+                        print(f"  [MEMO] Using cached result of {func.__name__} ({path})")
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
+            
+            result = func(*args, **kwargs)
+            # Only cache successful (non-empty) results
+            if result:
+                try:
+                    os.makedirs(MEMO_DIR, exist_ok=True)
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump(result, f, ensure_ascii=False)
+                except OSError as e:
+                    print(f"  Warning: Failed to write memo file {path}: {str(e)}")
+            return result
+        return wrapper
+    return decorator
+
+# Shared HTTP session: reuse TCP/TLS connections and retry on 429/5xx
+# (once retries run out the last response is returned to the status code checks instead of raising RetryError)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
+# Headers depend only on fixed config values; cache them instead of re-encoding per request (callers must not mutate the returned dict)
+@lru_cache(maxsize=4)
 def get_auth_headers(auth_type: str, api_token: str, email: str = None) -> Dict:
     """Generate authentication headers based on authType"""
     if auth_type == "Basic":
@@ -53,13 +107,14 @@ def get_base_url(config: Dict) -> str:
     else:
         raise ValueError(f"Unsupported authType: {auth_type}")
 
+@memo_json()
 def get_all_fields(base_url: str, auth_type: str, api_token: str, email: str = None) -> Dict[str, Dict[str, str]]:
     """Get all available custom field IDs, names, and data types from Jira project"""
     url = f"{base_url}/field"
     headers = get_auth_headers(auth_type, api_token, email)
     
     try:
-        response = requests.get(url, headers=headers)
+        response = SESSION.get(url, headers=headers)
         if response.status_code == 200:
             fields = response.json()
             # Extract custom field IDs, names, and types (customfield_*)
@@ -91,84 +146,96 @@ def get_all_fields(base_url: str, auth_type: str, api_token: str, email: str = N
         print(f"  Error: Failed to get field list: {str(e)}")
         return {}
 
-def get_all_issues(base_url: str, project_key: str, auth_type: str, api_token: str, email: str = None) -> List[Dict]:
-    """Get all issues from the target project"""
+def iter_all_issues(base_url: str, project_key: str, auth_type: str, api_token: str, email: str = None, max_results: int = 5000, fields: List[str] = None) -> Iterator[Dict]:
+    """
+    Yield all issues from the target project page by page (only the given fields, or all fields if not specified).
+    Raises RuntimeError if a page cannot be fetched, so a partial scan is never mistaken for a complete one.
+    """
     url = f"{base_url}/search/jql"
     headers = get_auth_headers(auth_type, api_token, email)
     
-    all_issues = []
-    start_at = 0
-    max_results = 100
+    retrieved_count = 0
+    # Use POST with a JSON body: the list of field IDs can be too long for a query string
+    body = {
+        "jql": f"project = {project_key}",
+        "maxResults": max_results,
+        "fields": fields or ["*all"]
+    }
     
     print(f"  Fetching all issues from project {project_key}...")
     
-    while True:
-        jql_query = f"project = {project_key}"
-        params = {
-            "jql": jql_query,
-            "maxResults": max_results,
-            "startAt": start_at,
-            "fields": "*all"  # Get all fields including custom fields
-        }
+    # Pages are fetched on a background thread: as soon as a page arrives, the
+    # request for the next page (known from its nextPageToken) is already sent
+    # while the current page is being processed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(SESSION.post, url, headers=headers, json=body)
         
-        try:
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code != 200:
-                print(f"  Error: Failed to get issues (Status {response.status_code}): {response.text}")
-                break
-            
-            data = response.json()
-            issues = data.get("issues", [])
-            
-            if not issues:
-                break
-            
-            all_issues.extend(issues)
-            print(f"  Retrieved {len(all_issues)} issues...", end='\r')
-            
-            # Check if there are more issues
-            # If returned issues count is less than max_results, we've got all issues
-            if len(issues) < max_results:
-                break
+        while future is not None:
+            try:
+                response = future.result()
+                future = None
+                
+                if response.status_code != 200:
+                    raise RuntimeError(f"Failed to get issues after {retrieved_count} issue(s) (Status {response.status_code}): {response.text}")
+                
+                data = response.json()
+                issues = data.get("issues", [])
+                
+                if not issues:
+                    break
+                
+                # The /search/jql API paginates with nextPageToken (startAt is not supported)
+                next_page_token = data.get("nextPageToken")
+                if next_page_token and not data.get("isLast", False):
+                    # Jira may cap the page size below the requested maxResults
+                    # (e.g. when all fields are requested); adapt to the effective cap
+                    if len(issues) < body["maxResults"]:
+                        print(f"  Note: Server returned {len(issues)} issues per page (requested {body['maxResults']}), using {len(issues)}")
+                        body["maxResults"] = len(issues)
+                    next_body = dict(body, nextPageToken=next_page_token)
+                    future = executor.submit(SESSION.post, url, headers=headers, json=next_body)
+                
+            except RuntimeError:
+                raise
+            except Exception as e:
+                raise RuntimeError(f"Failed to get issues after {retrieved_count} issue(s): {str(e)}") from e
             
-            start_at += max_results
-            
-        except Exception as e:
-            print(f"  Error: Failed to get issues: {str(e)}")
-            break
+            retrieved_count += len(issues)
+            print(f"  Retrieved {retrieved_count} issues...", end='\r')
+            yield from issues
     
-    print(f"  Retrieved {len(all_issues)} issues total")
-    return all_issues
+    print(f"  Retrieved {retrieved_count} issues total")
 
-def extract_custom_field_ids_from_issue(issue: Dict) -> Set[str]:
-    """Extract all custom field IDs used in an issue"""
-    fields = issue.get("fields", {})
-    custom_field_ids = set()
-    
-    for field_name, field_value in fields.items():
-        if field_name.startswith("customfield_") and field_value is not None:
-            # Check if the field has a value (not null/empty)
-            if isinstance(field_value, dict):
-                # For complex fields, check if they have meaningful content
-                if field_value:
-                    custom_field_ids.add(field_name)
-            elif isinstance(field_value, list):
-                # For array fields, check if not empty
-                if field_value:
-                    custom_field_ids.add(field_name)
-            else:
-                # For simple fields, check if not empty string
-                if field_value != "":
-                    custom_field_ids.add(field_name)
+@memo_json()
+def get_used_custom_fields(base_url: str, project_key: str, auth_type: str, api_token: str, email: str = None, fields: List[str] = None) -> Dict:
+    """
+    Scan all issues page by page and collect the custom fields used by at least one issue.
+    An incomplete scan raises (from iter_all_issues), so only complete results are memoized.
+    """
+    issue_count = 0
+    used_custom_fields = set()
+    for issue in iter_all_issues(base_url, project_key, auth_type, api_token, email, fields=fields):
+        issue_count += 1
+        # A field counts as used when its value is not null and not an empty dict, list or string
+        for field_name, field_value in issue.get("fields", {}).items():
+            if field_name in used_custom_fields or not field_name.startswith("customfield_"):
+                continue
+            if field_value is None or field_value == "" or field_value == {} or field_value == []:
+                continue
+            used_custom_fields.add(field_name)
     
-    return custom_field_ids
+    if not issue_count:
+        return {}
+    return {
+        "issue_count": issue_count,
+        "used_custom_fields": sorted(used_custom_fields)
+    }
 
 def extract_number_from_custom_field_id(field_id: str) -> int:
     """Extract the number from custom field ID (e.g., customfield_10229 -> 10229)"""
-    match = re.search(r'customfield_(\d+)', field_id)
-    if match:
-        return int(match.group(1))
+    number = field_id[len("customfield_"):]
+    if field_id.startswith("customfield_") and number.isdigit():
+        return int(number)
     return 0
 
 def find_unused_custom_fields(
@@ -228,23 +295,29 @@ def main():
     
     # 3. Get all issues and extract used custom fields
     print("Step 3: Analyzing custom field usage in all issues...")
-    all_issues = get_all_issues(
-        target_base_url,
-        project_key,
-        target_auth_type,
-        target_api_token,
-        target_email
-    )
+    # Only request the custom fields: system fields are never inspected and make up
+    # most of the response size (falls back to all fields if the field list is unavailable)
+    # Issues are processed page by page and never held in memory all at once
+    try:
+        usage = get_used_custom_fields(
+            target_base_url,
+            project_key,
+            target_auth_type,
+            target_api_token,
+            target_email,
+            fields=list(all_available_custom_fields)
+        )
+    except RuntimeError as e:
+        # Fields of the issues that were not scanned would be reported as unused
+        print(f"\n  Error: {str(e)}")
+        print("  Aborting: custom field usage cannot be determined from an incomplete scan")
+        return
     
-    if not all_issues:
+    if not usage:
         print("  Warning: No issues found in the project")
         return
     
-    # Collect all custom fields used by any issue
-    all_used_custom_fields = set()
-    for issue in all_issues:
-        used_fields = extract_custom_field_ids_from_issue(issue)
-        all_used_custom_fields.update(used_fields)
+    all_used_custom_fields = set(usage["used_custom_fields"])
     
     print(f"  ✓ Found {len(all_used_custom_fields)} custom fields used by at least one issue")
     print()
@@ -280,10 +353,11 @@ def main():
     print("-" * 100)
     print(f"{'Field ID':<30} {'Field Name':<40} {'Data Type':<30}")
     print("-" * 100)
-    for field_id, field_info in sorted_unused:
-        field_name = field_info.get("name", "Unknown")
-        field_type = field_info.get("type", "Unknown")
-        print(f"{field_id:<30} {field_name:<40} {field_type:<30}")
+    # Print the table in one write instead of one write per row
+    print("\n".join(
+        f"{field_id:<30} {field_info.get('name', 'Unknown'):<40} {field_info.get('type', 'Unknown'):<30}"
+        for field_id, field_info in sorted_unused
+    ))
     print("-" * 100)
     print()
     
@@ -1,9 +1,25 @@
 import requests
 import json
 import os
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 CONFIG_FILE = "jira_config.json"
 
+# Access Token 到期前預留的安全時間（秒）
+TOKEN_EXPIRY_BUFFER = 300
+
+# 共用的 HTTP Session：重複使用 TCP/TLS 連線，並對 429/5xx 自動重試
+# （重試用盡後回傳最後的回應，交給既有的狀態碼錯誤處理，而不是拋出 RetryError）
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
 def load_config():
     if not os.path.exists(CONFIG_FILE):
         raise FileNotFoundError(f"找不到 {CONFIG_FILE}，請先執行 auth_setup.py")
@@ -26,7 +42,7 @@ def get_fresh_access_token(config):
         "refresh_token": config["refresh_token"]
     }
     
-    response = requests.post(url, json=payload)
+    response = SESSION.post(url, json=payload)
     
     if response.status_code != 200:
         raise Exception(f"刷新 Token 失敗: {response.text}")
@@ -37,18 +53,27 @@ def get_fresh_access_token(config):
     
     # 重要：更新 config 中的 Refresh Token (Atlassian 會給一個新的，舊的會失效)
     config["refresh_token"] = new_refresh_token
+    # 一併快取 Access Token 與到期時間（預設有效 1 小時），未到期前不需再刷新
+    config["access_token"] = new_access_token
+    config["expires_at"] = time.time() + data.get("expires_in", 3600) - TOKEN_EXPIRY_BUFFER
     save_config(config)
     print("Token 刷新成功並已更新設定檔。")
     
     return new_access_token
 
+def get_access_token(config):
+    """取得有效的 Access Token：快取未到期時直接使用，否則用 Refresh Token 刷新"""
+    if config.get("access_token") and time.time() < config.get("expires_at", 0):
+        return config["access_token"]
+    return get_fresh_access_token(config)
+
 def get_issue_details(issue_key):
     # 1. 讀取設定
     config = load_config()
     
-    # 2. 取得有效 Token (建議每次執行都刷新，確保有效性)
+    # 2. 取得有效 Token (快取的 Token 到期前才刷新)
     try:
-        access_token = get_fresh_access_token(config)
+        access_token = get_access_token(config)
     except Exception as e:
         print(f"錯誤: {e}")
         return
@@ -63,7 +88,7 @@ def get_issue_details(issue_key):
     }
     
     print(f"正在查詢 Issue: {issue_key} ...")
-    response = requests.get(api_url, headers=headers)
+    response = SESSION.get(api_url, headers=headers)
     
     if response.status_code == 200:
         issue_data = response.json()
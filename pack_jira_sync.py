@@ -1,20 +1,20 @@
 """
-Utility script to package selected project files into a 7z archive while
-temporarily sanitizing sensitive fields in jira_config.json.
+Utility script to package selected project files into a 7z archive with
+sensitive fields in jira_config.json sanitized.
 
 Steps performed:
-1. Load jira_config.json and stash the original content in memory.
-2. Overwrite jira_config.json with placeholder values:
+1. Load jira_config.json.
+2. Write a sanitized copy into a temporary directory with placeholder values
+   (the original jira_config.json is never modified):
    - source.email -> "YOUR-EMAIL-ADDRESS"
    - source.apiToken -> "YOUR-API-TOKEN"
    - target.apiToken -> "YOUR-API-TOKEN" (kept consistent for safety)
 3. Create jira_sync_automation.7z containing:
-   - jira_config.json
+   - jira_config.json (the sanitized copy)
    - jira_field_mapping.json
    - sync_issues.py
    - README.md
    - requirements.txt
-4. Restore the original jira_config.json even if packaging fails.
 
 Usage:
     python pack_jira_sync.py
@@ -26,6 +26,7 @@ Prerequisites:
 import json
 import subprocess
 import shutil
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -55,24 +56,27 @@ def save_config(path: Path, data: Dict[str, Any]) -> None:
 
 def sanitize_config(data: Dict[str, Any]) -> Dict[str, Any]:
     """Return a sanitized copy with placeholders; does not mutate input."""
-    import copy
-
-    sanitized = copy.deepcopy(data)
-    source_cfg = sanitized.get("source", {})
-    target_cfg = sanitized.get("target", {})
-
-    if isinstance(source_cfg, dict):
-        if "email" in source_cfg:
-            source_cfg["email"] = "YOUR-EMAIL-ADDRESS"
-        if "apiToken" in source_cfg:
-            source_cfg["apiToken"] = "YOUR-API-TOKEN"
-        if "projectKey" in source_cfg:
-            source_cfg["projectKey"] = "YOUR-PROJECT-KEY"
-    if isinstance(target_cfg, dict):
-        if "apiToken" in target_cfg:
-            target_cfg["apiToken"] = "YOUR-API-TOKEN"
-        if "projectKey" in target_cfg:
-            target_cfg["projectKey"] = "YOUR-PROJECT-KEY"
+    # Only the source/target sections are copied; all other values are shared with the input
+    placeholders = {
+        "source": {
+            "email": "YOUR-EMAIL-ADDRESS",
+            "apiToken": "YOUR-API-TOKEN",
+            "projectKey": "YOUR-PROJECT-KEY",
+        },
+        "target": {
+            "apiToken": "YOUR-API-TOKEN",
+            "projectKey": "YOUR-PROJECT-KEY",
+        },
+    }
+
+    sanitized = dict(data)
+    for section, values in placeholders.items():
+        section_cfg = data.get(section)
+        if isinstance(section_cfg, dict):
+            sanitized[section] = {
+                **section_cfg,
+                **{key: value for key, value in values.items() if key in section_cfg},
+            }
     return sanitized
 
 
@@ -108,11 +112,16 @@ def find_7z_executable() -> str:
     )
 
 
-def create_7z_archive(files: List[Path], output_path: Path) -> None:
+def create_7z_archive(files: List[Path], output_path: Path, level: int = 3, threads: str = "on") -> None:
+    """Create the archive: multithreaded (-mmt), solid (-ms=on) LZMA2 at the given level (-mx)."""
     if not files:
         raise RuntimeError("No files to package.")
     seven_zip = find_7z_executable()
-    cmd = [seven_zip, "a", "-t7z", str(output_path)] + [str(p) for p in files]
+    cmd = [
+        seven_zip, "a", "-t7z",
+        f"-mmt={threads}", f"-mx={level}", "-ms=on",
+        str(output_path),
+    ] + [str(p) for p in files]
     print(f"[Info] Running: {' '.join(cmd)}")
     subprocess.run(cmd, check=True)
     print(f"[Done] Created archive: {output_path}")
@@ -124,20 +133,18 @@ def main():
 
     original_config = load_config(CONFIG_PATH)
     sanitized_config = sanitize_config(original_config)
+    files = build_file_list(FILES_TO_PACKAGE)
 
-    try:
-        # Write sanitized config
-        save_config(CONFIG_PATH, sanitized_config)
+    # Stage the sanitized config under the same file name in a temporary directory
+    # (7z stores files by name), so the original jira_config.json is never rewritten
+    with tempfile.TemporaryDirectory() as staging_dir:
+        staged_config = Path(staging_dir) / CONFIG_PATH.name
+        save_config(staged_config, sanitized_config)
         print("[Info] jira_config.json sanitized for packaging.")
 
-        files = build_file_list(FILES_TO_PACKAGE)
+        files = [staged_config if p == CONFIG_PATH else p for p in files]
         create_7z_archive(files, OUTPUT_7Z)
 
-    finally:
-        # Restore original config no matter what happens
-        save_config(CONFIG_PATH, original_config)
-        print("[Info] jira_config.json restored to original content.")
-
 
 if __name__ == "__main__":
     main()
@@ -5,15 +5,24 @@ Sync Issues from Source Jira to Target Jira
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 import re
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 # Configuration files
 CONFIG_FILE = "jira_config.json"
 MAPPING_FILE = "jira_field_mapping.json"
+# Incremental sync cursor (written after each successful run when incrementalSync is enabled)
+STATE_FILE = ".sync_state.json"
+
+# Concurrent attachment downloads per issue (on top of syncWorkers)
+ATTACHMENT_WORKERS = 4
 
 # Debug mode settings. When DEBUG_MODE is True:
 #     1. Will use "Test" type to query Source Issues, and use "Bug" type to create Target Issue
@@ -30,6 +39,10 @@ try:
         source_config = config.get("source", {})
         target_config = config.get("target", {})
         sync_issue_types = config.get("syncIssueType", [])
+        # Number of issues synchronized concurrently
+        sync_workers = config.get("syncWorkers", 8)
+        # Only query source issues updated since the last successful run
+        incremental_sync = config.get("incrementalSync", False)
 except Exception as e:
     raise ValueError(f"Error: Cannot read {CONFIG_FILE}: {e}")
 
@@ -87,8 +100,21 @@ def get_base_url(config: Dict) -> str:
     else:
         raise ValueError(f"Unsupported authType: {auth_type}")
 
+class RateLimitRetry(Retry):
+    """Retry policy that also retries POST requests (search, create) on 429: a rate limited request was not processed"""
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
 class JiraClient:
     """Jira client supporting Basic and Bearer authentication"""
+    # Upload attachment requires multipart/form-data (merged over the session headers, never modified)
+    UPLOAD_HEADERS = {
+        'Content-Type': None,  # Remove session Content-Type to let requests set it automatically
+        'X-Atlassian-Token': 'no-check'  # Jira API requires X-Atlassian-Token header
+    }
+
     def __init__(self, config: Dict):
         self.config = config
         self.auth_type = config.get("authType", "Basic")
@@ -96,12 +122,27 @@ class JiraClient:
         self.email = config.get("email")
         self.base_url = get_base_url(config)
         self.headers = get_auth_headers(self.auth_type, self.api_token, self.email)
+        # Persistent session: reuse TCP/TLS connections (keep-alive) and retry on 429/5xx
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            # Room for every sync worker plus its attachment downloads
+            pool_maxsize=max(20, sync_workers * ATTACHMENT_WORKERS),
+            # Retry-After is honoured; the last response is returned (not raised) once retries are exhausted
+            max_retries=RateLimitRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        ))
 
     def test_connection(self):
         """Test connection to Jira API"""
         try:
             url = f"{self.base_url}/myself"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url)
             if response.status_code == 200:
                 user_info = response.json()
                 print(f"  ✅ Connection successful - User: {user_info.get('displayName', 'N/A')} ({user_info.get('accountId', 'N/A')})")
@@ -134,20 +175,20 @@ class JiraClient:
             print(f"  Operation: {operation}")
             print(f"  URL: {response.url}")
 
-    def search_issues(self, jql: str, max_results: int = 100):
-        """Search Issues using the /search/jql API"""
+    def iter_issues(self, jql: str, fields: Optional[List[str]] = None, max_results: int = 5000):
+        """Yield Issues page by page using the /search/jql API (nextPageToken pagination)"""
         url = f"{self.base_url}/search/jql"
-        all_issues = []
-        start_at = 0
+        # POST with a JSON body: the field list can be long, and no expand/rendering is requested
+        payload = {
+            "jql": jql,
+            "maxResults": max_results,
+            # Only request the fields that are actually used (all fields if not specified)
+            "fields": fields or ["*all", "attachment"],
+            "fieldsByKeys": False
+        }
         
         while True:
-            params = {
-                "jql": jql,
-                "maxResults": max_results,
-                "startAt": start_at,
-                "fields": "*all,attachment"  # Ensure attachment field is included
-            }
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self.session.post(url, json=payload)
             
             if not response.ok:
                 self._handle_error(response, f"search_issues (JQL: {jql})")
@@ -159,20 +200,22 @@ class JiraClient:
             if not issues:
                 break
             
-            all_issues.extend(issues)
+            yield from issues
             
-            # Check if there are more results
-            if len(issues) < max_results:
+            # /search/jql ignores startAt; continue with the token of the next page
+            next_page_token = data.get('nextPageToken')
+            if not next_page_token or data.get('isLast', False):
                 break
-            
-            start_at += max_results
-        
-        return all_issues
+            payload["nextPageToken"] = next_page_token
+
+    def search_issues(self, jql: str, max_results: int = 5000, fields: Optional[List[str]] = None):
+        """Search Issues using the /search/jql API"""
+        return list(self.iter_issues(jql, fields, max_results))
 
     def create_issue(self, payload):
         """Create Issue"""
         url = f"{self.base_url}/issue"
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload)
         if response.status_code == 201:
             key = response.json()['key']
             print(f"  [Created] New issue key: {key}")
@@ -187,18 +230,20 @@ class JiraClient:
         """Update Issue"""
         url = f"{self.base_url}/issue/{issue_key}"
         payload = {"fields": fields_dict}
-        response = requests.put(url, headers=self.headers, json=payload)
+        response = self.session.put(url, json=payload)
         if response.status_code == 204:
             print(f"  [Updated] {issue_key} fields updated.")
+            return True
         else:
             if not response.ok:
                 self._handle_error(response, f"update_issue (key: {issue_key})")
             print(f"  [Error Update] {response.status_code}: {response.text}")
+            return False
 
     def get_transitions(self, issue_key):
         """Get available transitions for an issue"""
         url = f"{self.base_url}/issue/{issue_key}/transitions"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url)
         if response.status_code == 200:
             data = response.json()
             return data.get("transitions", [])
@@ -223,7 +268,7 @@ class JiraClient:
 
         url = f"{self.base_url}/issue/{issue_key}/transitions"
         payload = {"transition": {"id": target_transition_id}}
-        response = requests.post(url, headers=self.headers, json=payload)
+        response = self.session.post(url, json=payload)
         if response.status_code == 204:
             print(f"  [Transitioned] {issue_key} -> {status_name}")
             return True
@@ -236,7 +281,7 @@ class JiraClient:
         """Get all attachments of an Issue"""
         url = f"{self.base_url}/issue/{issue_key}"
         params = {"fields": "attachment"}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, params=params)
         if response.status_code == 200:
             issue_data = response.json()
             return issue_data.get('fields', {}).get('attachment', [])
@@ -251,32 +296,28 @@ class JiraClient:
             return False
         
         try:
-            response = requests.get(content_url, headers=self.headers, stream=True)
-            if response.status_code == 200:
-                with open(local_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                return True
-            else:
-                print(f"    Warning: Cannot download attachment (Status {response.status_code})")
-                return False
+            # Context manager releases the pooled connection even if writing fails
+            with self.session.get(content_url, stream=True) as response:
+                if response.status_code == 200:
+                    # Copy the body in 1 MiB blocks (decode_content handles gzip/deflate transfer encoding)
+                    response.raw.decode_content = True
+                    with open(local_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, 1024 * 1024)
+                    return True
+                else:
+                    print(f"    Warning: Cannot download attachment (Status {response.status_code})")
+                    return False
         except Exception as e:
             print(f"    Error: Error occurred while downloading attachment: {str(e)}")
             return False
 
-    def upload_attachment(self, issue_key, file_path):
-        """Upload attachment to Issue"""
+    def upload_attachment(self, issue_key, file_path, upload_name=None):
+        """Upload attachment to Issue (upload_name overrides the local file name)"""
         url = f"{self.base_url}/issue/{issue_key}/attachments"
-        # Upload attachment requires multipart/form-data
-        headers = self.headers.copy()
-        headers.pop('Content-Type', None)  # Remove Content-Type to let requests set it automatically
-        # Jira API requires X-Atlassian-Token header
-        headers['X-Atlassian-Token'] = 'no-check'
-        
         try:
             with open(file_path, 'rb') as f:
-                files = {'file': (os.path.basename(file_path), f, 'application/octet-stream')}
-                response = requests.post(url, headers=headers, files=files)
+                files = {'file': (upload_name or os.path.basename(file_path), f, 'application/octet-stream')}
+                response = self.session.post(url, headers=self.UPLOAD_HEADERS, files=files)
             
             if response.status_code == 200:
                 return True
@@ -287,10 +328,134 @@ class JiraClient:
             print(f"    Error: Error occurred while uploading attachment: {str(e)}")
             return False
 
+    def upload_attachments(self, issue_key, uploads):
+        """
+        Upload several attachments to Issue in one multipart request (one request per file if it is too large).
+        uploads: list of (file_path, upload_name) pairs.
+        Returns the upload names that could not be uploaded (empty list if all succeeded).
+        """
+        if len(uploads) <= 1:
+            return [name for p, name in uploads if not self.upload_attachment(issue_key, p, name)]
+        
+        url = f"{self.base_url}/issue/{issue_key}/attachments"
+        opened_files = []
+        try:
+            # One 'file' part per attachment
+            files = []
+            for file_path, upload_name in uploads:
+                f = open(file_path, 'rb')
+                opened_files.append(f)
+                files.append(('file', (upload_name, f, 'application/octet-stream')))
+            response = self.session.post(url, headers=self.UPLOAD_HEADERS, files=files)
+        except Exception as e:
+            print(f"    Error: Error occurred while uploading attachments: {str(e)}")
+            return [name for p, name in uploads]
+        finally:
+            for f in opened_files:
+                f.close()
+        
+        if response.status_code == 200:
+            return []
+        if response.status_code == 413:
+            print(f"    Warning: Attachments too large for one request, uploading one by one")
+            return [name for p, name in uploads if not self.upload_attachment(issue_key, p, name)]
+        self._handle_error(response, f"upload_attachments (key: {issue_key})")
+        return [name for p, name in uploads]
+
+class CompiledMapping(NamedTuple):
+    """Mapping item with its config values extracted and defaulted once"""
+    item: Dict  # Original mapping item (passed to format_field_value)
+    strategy: str
+    sync_direction: str
+    is_system: bool
+    source_field: Optional[str]  # fieldId for system fields, sourceFieldId for custom fields
+    target_field: Optional[str]  # fieldId for system fields, targetFieldId for custom fields
+    target_field_id: Optional[str]  # targetFieldId (STATIC_VALUE / SYNC_METADATA)
+    trigger_on: frozenset
+    static_value: Any
+    metadata_type: Optional[str]
+    prefix: str
+    value_key: Optional[str]  # MAPPED_SYNC S2T result format: {"name": ...}, {"value": ...} or plain (None)
+    reverse_map: Dict  # MAPPED_SYNC T2S lookup (target value -> source value)
+
+def get_mapped_value_key(item: Dict) -> Optional[str]:
+    """Return the key a MAPPED_SYNC S2T value is wrapped in for the target field, None for a plain string"""
+    # Priority field requires {"name": "..."} format
+    if item.get('type') == 'system' and item.get('fieldId', '') == 'priority':
+        return 'name'
+    # Custom fields (option list) require {"value": "..."} format
+    if item.get('type') == 'custom' or (item.get('targetFieldId') or '').startswith('customfield_'):
+        return 'value'
+    # Other system fields use a string
+    return None
+
+def build_reverse_map(item: Dict) -> Dict:
+    """Build T2S lookup: explicit reverseMapping overrides the inverted valueMapping"""
+    reverse_map = {}
+    # Invert valueMapping, keeping the first source value for duplicate target values
+    for k, v in item.get('valueMapping', {}).items():
+        reverse_map.setdefault(v, k)
+    reverse_map.update(item.get('reverseMapping', {}))
+    return reverse_map
+
+def compile_mapping(item: Dict) -> CompiledMapping:
+    """Extract the values of a mapping item used by the payload builders"""
+    is_system = item.get('type') == 'system'
+    trigger_on = item.get('triggerOn', item.get('trigger_on', ['CREATE', 'UPDATE']))
+    if isinstance(trigger_on, str):
+        trigger_on = [trigger_on]
+    return CompiledMapping(
+        item=item,
+        strategy=item.get('strategy', 'DIRECT_COPY'),
+        sync_direction=item.get('syncDirection', 'S2T'),
+        is_system=is_system,
+        source_field=item.get('fieldId') if is_system else item.get('sourceFieldId'),
+        target_field=item.get('fieldId') if is_system else item.get('targetFieldId'),
+        target_field_id=item.get('targetFieldId'),
+        trigger_on=frozenset(trigger_on),
+        static_value=item.get('staticValue', item.get('static_value', {})),
+        metadata_type=item.get('metadataType'),
+        prefix=item.get('prefix', ''),
+        value_key=get_mapped_value_key(item),
+        reverse_map=build_reverse_map(item)
+    )
+
+# Keys of a plain option/name object; a value with any other key (e.g. a cascading select's child) is never treated as unchanged
+SIMPLE_OBJECT_KEYS = frozenset(('value', 'name', 'id', 'self'))
+
 class FieldProcessor:
     """Handle field mapping logic"""
     def __init__(self, mapping_config):
         self.mapping_config = mapping_config
+        # Mapping items with their config values extracted once, instead of per issue
+        self.compiled = [compile_mapping(item) for item in mapping_config]
+        # Mapping items applicable to each sync direction, filtered once instead of per issue
+        self.direction_items = {
+            direction: [m for m in self.compiled if m.sync_direction in (direction, 'BIDIRECTIONAL')]
+            for direction in ('S2T', 'T2S')
+        }
+        # SYNC_METADATA items keyed by (metadataType, targetFieldId); the first item wins, as with the former linear scan
+        self.metadata_configs = {}
+        for m in self.compiled:
+            if m.strategy == 'SYNC_METADATA':
+                self.metadata_configs.setdefault((m.metadata_type, m.target_field_id), m.item)
+        # STATIC_VALUE fields set right after creation are the same for every issue
+        self.static_create_fields = self._build_static_create_fields()
+
+    def _build_static_create_fields(self):
+        """Formatted values of STATIC_VALUE fields triggered on CREATE, keyed by target field ID"""
+        static_fields = {}
+        for m in self.compiled:
+            if m.strategy == 'STATIC_VALUE' and 'CREATE' in m.trigger_on and m.target_field_id:
+                # Extract actual value
+                if isinstance(m.static_value, dict):
+                    actual_value = m.static_value.get('value', m.static_value)
+                else:
+                    actual_value = m.static_value
+                
+                # Use format_field_value to format field value
+                static_fields[m.target_field_id] = self.format_field_value(actual_value, m.item)
+        return static_fields
 
     def adf_to_text(self, adf_content):
         """Convert ADF (Atlassian Document Format) to plain text string"""
@@ -379,13 +544,18 @@ class FieldProcessor:
         if not isinstance(adf_content, dict) or adf_content.get('type') != 'doc':
             return None
         
-        # Deep copy ADF structure
-        import copy
-        new_adf = copy.deepcopy(adf_content)
+        prefix_node = {
+            "type": "text",
+            "text": f"{prefix} "
+        }
+        # Copy only the containers that change (document, its content list and the modified paragraph);
+        # all other nodes are shared with the input, which is never modified
+        new_adf = dict(adf_content)
+        content = list(new_adf.get('content', []))
+        new_adf['content'] = content
         
         # Find the first text node in the first paragraph
-        content = new_adf.get('content', [])
-        for paragraph in content:
+        for idx, paragraph in enumerate(content):
             if paragraph.get('type') == 'paragraph':
                 para_content = paragraph.get('content', [])
                 # Find the first text node
@@ -395,33 +565,39 @@ class FieldProcessor:
                         # Check if prefix already exists
                         if not text.startswith(prefix):
                             # Insert prefix text node before the first text node
-                            prefix_node = {
-                                "type": "text",
-                                "text": f"{prefix} "
-                            }
-                            para_content.insert(i, prefix_node)
+                            new_paragraph = dict(paragraph)
+                            new_paragraph['content'] = para_content[:i] + [prefix_node] + para_content[i:]
+                            content[idx] = new_paragraph
                         return new_adf
         
         # If no text node found, add prefix and text in the first paragraph
         if content and content[0].get('type') == 'paragraph':
-            content[0].setdefault('content', []).insert(0, {
-                "type": "text",
-                "text": f"{prefix} "
-            })
+            new_paragraph = dict(content[0])
+            new_paragraph['content'] = [prefix_node] + list(new_paragraph.get('content', []))
+            content[0] = new_paragraph
         else:
             # Create new paragraph
             new_adf['content'] = [{
                 "type": "paragraph",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"{prefix} "
-                    }
-                ]
+                "content": [prefix_node]
             }]
         
         return new_adf
 
+    def apply_prefix(self, value, prefix):
+        """Add the configured field prefix to an ADF document or a string value (other values are returned unchanged)"""
+        # If value is ADF format (dict), add prefix directly in ADF
+        if isinstance(value, dict) and value.get('type') == 'doc':
+            prefixed_adf = self.add_prefix_to_adf(value, prefix)
+            # If adding failed, use original ADF content directly
+            return prefixed_adf if prefixed_adf is not None else value
+        # Handle string type prefix
+        if isinstance(value, str):
+            # Check if prefix already exists
+            if not value.startswith(prefix):
+                return f'{prefix} {value}'
+        return value
+
     def format_field_value(self, field_value, config_item):
         """Format field value based on field type"""
         target_field_id = config_item.get('targetFieldId', '')
@@ -460,16 +636,21 @@ class FieldProcessor:
                 return field_value
         
         # If type not specified, infer from field ID
-        if 'customfield' in str(target_field_id):
+        if (target_field_id or '').startswith('customfield_'):
             # For custom fields, if string, assume option list, use {"value": "..."} format
             if isinstance(field_value, str):
                 return {"value": field_value}
         
         return field_value
 
-    def resolve_value(self, input_val, config_item, direction="S2T"):
-        """Resolve field value and transform based on strategy"""
-        strategy = config_item.get('strategy', 'DIRECT_COPY')
+    def resolve_value(self, input_val, m: CompiledMapping, direction="S2T"):
+        """Resolve field value and transform based on strategy of the compiled mapping item"""
+        config_item = m.item
+        strategy = m.strategy
+
+        # Most common strategy first
+        if strategy == 'DIRECT_COPY':
+            return input_val
 
         if strategy == 'STATIC_VALUE':
             static_value = config_item.get('static_value', {})
@@ -479,9 +660,6 @@ class FieldProcessor:
             # SYNC_METADATA strategy is handled in prepare_create_payload and prepare_update_payload
             return None
 
-        if strategy == 'DIRECT_COPY':
-            return input_val
-
         if strategy == 'MAPPED_SYNC':
             # Handle object value extraction (e.g., priority: {name: 'High'})
             raw_val = input_val
@@ -492,36 +670,40 @@ class FieldProcessor:
                 mapping = config_item.get('valueMapping', {})
                 mapped_val = mapping.get(raw_val)
                 # Return appropriate format based on field type
+                # (decided once per mapping item in compile_mapping)
                 if mapped_val:
-                    field_type = config_item.get('type')
-                    field_id = config_item.get('fieldId', '')
-                    
-                    # Priority field requires {"name": "..."} format
-                    if field_type == 'system' and field_id == 'priority':
-                        return {"name": mapped_val}
-                    
-                    # Custom fields (option list) require {"value": "..."} format
-                    if field_type == 'custom' or 'customfield' in str(config_item.get('targetFieldId', '')):
-                        return {"value": mapped_val}
-                    
-                    # Other system fields return string
-                    return mapped_val
+                    return {m.value_key: mapped_val} if m.value_key else mapped_val
                 return None
 
             elif direction == "T2S":
-                # 1. Check reverseMapping (Explicit)
-                reverse_map = config_item.get('reverseMapping', {})
-                if raw_val in reverse_map:
-                    return {"value": reverse_map[raw_val]}
-
-                # 2. Check valueMapping reverse (Implicit)
-                forward_map = config_item.get('valueMapping', {})
-                for k, v in forward_map.items():
-                    if v == raw_val:
-                        return {"value": k}
+                # reverseMapping (explicit) first, then valueMapping reversed (implicit), built once per item
+                if raw_val in m.reverse_map:
+                    return {"value": m.reverse_map[raw_val]}
         
         return None
 
+    @staticmethod
+    def _is_same_value(new_val, current_val, value_key=None):
+        """
+        Check whether a simple field value (text, number, single option/name object) is unchanged.
+        value_key: the key ("value" or "name") the field's option object uses (None for plain fields).
+        """
+        if current_val is None:
+            return False
+        # A cascading select's current child must be compared too: leave it to the update
+        if isinstance(current_val, dict) and 'child' in current_val:
+            return False
+        if isinstance(new_val, (str, int, float)) and not isinstance(new_val, bool):
+            if isinstance(current_val, dict):
+                return value_key is not None and new_val == current_val.get(value_key)
+            return new_val == current_val
+        if isinstance(new_val, dict) and isinstance(current_val, dict) and new_val.keys() <= SIMPLE_OBJECT_KEYS:
+            for key in ('value', 'name'):
+                if key in new_val:
+                    return new_val[key] == current_val.get(key)
+        # Complex values (ADF, arrays, cascading selects, ...) are always updated
+        return False
+
     def prepare_create_payload(self, source_issue, target_project_key, issue_type, customer_issue_id_field: str):
         """Prepare payload for creating Issue"""
         payload = {
@@ -530,68 +712,40 @@ class FieldProcessor:
                 "issuetype": {"name": issue_type}
             }
         }
+        src_fields = source_issue['fields']
 
-        for item in self.mapping_config:
-            sync_direction = item.get('syncDirection', 'S2T')
-            if sync_direction != 'S2T' and sync_direction != 'BIDIRECTIONAL':
-                continue
-
-            strategy = item.get('strategy', 'DIRECT_COPY')
-            
+        for m in self.direction_items['S2T']:
             # Handle SYNC_METADATA strategy
             # Note: These fields are not set during creation, but updated immediately after creation
             # because some issue type creation screens may not include these fields
-            if strategy == 'SYNC_METADATA':
+            if m.strategy == 'SYNC_METADATA':
                 # Skip, will be updated separately after issue creation
                 continue
 
             # Handle STATIC_VALUE strategy
             # Note: Some STATIC_VALUE fields may not be settable during creation (e.g., some issue type creation screens don't include these fields)
             # These fields will be updated separately after creation
-            if strategy == 'STATIC_VALUE':
-                trigger_on = item.get('triggerOn', item.get('trigger_on', ['CREATE', 'UPDATE']))
-                if 'CREATE' in trigger_on:
-                    # Temporarily skip, will be updated separately after creation (to avoid field restrictions during creation)
-                    # If needed, add logic here to determine which fields can be set during creation
-                    continue
+            if m.strategy == 'STATIC_VALUE' and 'CREATE' in m.trigger_on:
+                # Temporarily skip, will be updated separately after creation (to avoid field restrictions during creation)
+                # If needed, add logic here to determine which fields can be set during creation
+                continue
 
             # Handle general fields
-            field_type = item.get('type')
-            
-            if field_type == 'system':
-                # System fields use fieldId
-                source_field = item.get('fieldId')
-                target_field = item.get('fieldId')  # System fields usually have the same name
-            else:
-                # Custom fields use sourceFieldId and targetFieldId
-                source_field = item.get('sourceFieldId')
-                target_field = item.get('targetFieldId')
+            source_field = m.source_field
+            target_field = m.target_field
             
             if source_field and target_field:
                 # Skip attachment field, as Jira API does not allow setting attachment during creation
-                if field_type == 'system' and source_field == 'attachment':
+                if m.is_system and source_field == 'attachment':
                     continue
                 
-                src_val = source_issue['fields'].get(source_field)
+                src_val = src_fields.get(source_field)
                 if src_val is not None:
-                    target_val = self.resolve_value(src_val, item, "S2T")
+                    target_val = self.resolve_value(src_val, m, "S2T")
                     if target_val is not None:
                         # Handle field prefix (read from config, supports all S2T direction fields)
-                        prefix = item.get('prefix', '')
-                        if prefix:
-                            # If value is ADF format (dict), add prefix directly in ADF
-                            if isinstance(target_val, dict) and target_val.get('type') == 'doc':
-                                # Save original value for fallback
-                                original_adf = target_val
-                                target_val = self.add_prefix_to_adf(target_val, prefix)
-                                if target_val is None:
-                                    # If adding failed, use original ADF content directly
-                                    target_val = original_adf
-                            # Handle string type prefix
-                            elif isinstance(target_val, str):
-                                # Check if prefix already exists
-                                if not target_val.startswith(prefix):
-                                    target_val = f'{prefix} {target_val}'
+                        if m.prefix:
+                            target_val = self.apply_prefix(target_val, m.prefix)
                         payload["fields"][target_field] = target_val
 
         return payload
@@ -599,120 +753,102 @@ class FieldProcessor:
     def prepare_update_payload(self, source_issue, target_issue, direction: str, customer_issue_id_field: str, last_sync_time_field: str):
         """Prepare payload for updating Issue"""
         update_fields = {}
+        src_fields = source_issue['fields']
+        tgt_fields = target_issue['fields']
+        # One sync time for all last_sync_time items of this update
+        current_time = datetime.now().isoformat()
 
-        for item in self.mapping_config:
-            sync_direction = item.get('syncDirection', 'S2T')
-            
-            # Check sync direction
-            if sync_direction != "BIDIRECTIONAL" and sync_direction != direction:
-                continue
-
-            strategy = item.get('strategy', 'DIRECT_COPY')
-            
+        # Only items for this sync direction
+        for m in self.direction_items.get(direction, []):
             # Ignore STATIC_VALUE that only triggers on Create
-            if strategy == 'STATIC_VALUE':
-                trigger_on = item.get('triggerOn', item.get('trigger_on', ['CREATE', 'UPDATE']))
-                if 'UPDATE' not in trigger_on:
+            if m.strategy == 'STATIC_VALUE':
+                if 'UPDATE' not in m.trigger_on:
                     continue
                 # Handle STATIC_VALUE update
-                static_value = item.get('staticValue', item.get('static_value', {}))
-                target_field_id = item.get('targetFieldId')
-                if target_field_id:
-                    if isinstance(static_value, dict):
-                        update_fields[target_field_id] = static_value.get('value')
+                if m.target_field_id:
+                    if isinstance(m.static_value, dict):
+                        update_fields[m.target_field_id] = m.static_value.get('value')
                     else:
-                        update_fields[target_field_id] = static_value
+                        update_fields[m.target_field_id] = m.static_value
                 continue
 
             # Handle SYNC_METADATA strategy
-            if strategy == 'SYNC_METADATA':
-                metadata_type = item.get('metadataType')
-                target_field_id = item.get('targetFieldId')
-                
-                if metadata_type == 'last_sync_time' and target_field_id:
+            if m.strategy == 'SYNC_METADATA':
+                if m.metadata_type == 'last_sync_time' and m.target_field_id:
                     # Update sync time
-                    current_time = datetime.now().isoformat()
-                    update_fields[target_field_id] = current_time
+                    update_fields[m.target_field_id] = current_time
                 continue
 
-            field_type = item.get('type')
+            source_field = m.source_field
+            target_field = m.target_field
+            if not (source_field and target_field):
+                continue
             
             if direction == "S2T":
-                if field_type == 'system':
-                    # System fields use fieldId
-                    source_field = item.get('fieldId')
-                    target_field = item.get('fieldId')
-                else:
-                    # Custom fields use sourceFieldId and targetFieldId
-                    source_field = item.get('sourceFieldId')
-                    target_field = item.get('targetFieldId')
+                # Skip attachment field, as Jira API does not allow setting attachment through field update API
+                # attachment should be handled through dedicated attachment API
+                if m.is_system and source_field == 'attachment':
+                    continue
                 
-                if source_field and target_field:
-                    # Skip attachment field, as Jira API does not allow setting attachment through field update API
-                    # attachment should be handled through dedicated attachment API
-                    if field_type == 'system' and source_field == 'attachment':
-                        continue
-                    
-                    src_val = source_issue['fields'].get(source_field)
-                    if src_val is not None:
-                        val = self.resolve_value(src_val, item, "S2T")
-                        if val is not None:
-                            if field_type == 'system' and source_field == 'status':
-                                src_name = None
-                                if isinstance(src_val, dict):
-                                    src_name = src_val.get('name') or src_val.get('value')
-                                elif isinstance(src_val, str):
-                                    src_name = src_val
-                                print(f"    [Status S2T] source status: {src_name} -> mapped: {val}")
-                            # Handle field prefix (read from config, supports all S2T direction fields)
-                            prefix = item.get('prefix', '')
-                            if prefix:
-                                # If value is ADF format (dict), add prefix directly in ADF
-                                if isinstance(val, dict) and val.get('type') == 'doc':
-                                    # Save original value for fallback
-                                    original_adf = val
-                                    val = self.add_prefix_to_adf(val, prefix)
-                                    if val is None:
-                                        # If adding failed, use original ADF content directly
-                                        val = original_adf
-                                # Handle string type prefix
-                                elif isinstance(val, str):
-                                    # Check if prefix already exists
-                                    if not val.startswith(prefix):
-                                        val = f'{prefix} {val}'
-                            update_fields[target_field] = val
+                src_val = src_fields.get(source_field)
+                if src_val is not None:
+                    val = self.resolve_value(src_val, m, "S2T")
+                    if val is not None:
+                        if m.is_system and source_field == 'status':
+                            src_name = None
+                            if isinstance(src_val, dict):
+                                src_name = src_val.get('name') or src_val.get('value')
+                            elif isinstance(src_val, str):
+                                src_name = src_val
+                            print(f"    [Status S2T] source status: {src_name} -> mapped: {val}")
+                        # Handle field prefix (read from config, supports all S2T direction fields)
+                        if m.prefix:
+                            val = self.apply_prefix(val, m.prefix)
+                        # Skip no-op updates for simple fields
+                        if self._is_same_value(val, tgt_fields.get(target_field), m.value_key):
+                            continue
+                        update_fields[target_field] = val
 
             elif direction == "T2S":
-                if field_type == 'system':
-                    # System fields use fieldId
-                    source_field = item.get('fieldId')
-                    target_field = item.get('fieldId')
-                else:
-                    # Custom fields use sourceFieldId and targetFieldId
-                    source_field = item.get('sourceFieldId')
-                    target_field = item.get('targetFieldId')
+                # Skip attachment field, as Jira API does not allow setting attachment through field update API
+                # attachment should be handled through dedicated attachment API
+                if m.is_system and target_field == 'attachment':
+                    continue
                 
-                if source_field and target_field:
-                    # Skip attachment field, as Jira API does not allow setting attachment through field update API
-                    # attachment should be handled through dedicated attachment API
-                    if field_type == 'system' and target_field == 'attachment':
-                        continue
-                    
-                    tgt_val = target_issue['fields'].get(target_field)
-                    if tgt_val is not None:
-                        val = self.resolve_value(tgt_val, item, "T2S")
-                        if val is not None:
-                            if field_type == 'system' and target_field == 'status':
-                                tgt_name = None
-                                if isinstance(tgt_val, dict):
-                                    tgt_name = tgt_val.get('name') or tgt_val.get('value')
-                                elif isinstance(tgt_val, str):
-                                    tgt_name = tgt_val
-                                print(f"    [Status T2S] target status: {tgt_name} -> mapped: {val}")
-                            update_fields[source_field] = val
+                tgt_val = tgt_fields.get(target_field)
+                if tgt_val is not None:
+                    val = self.resolve_value(tgt_val, m, "T2S")
+                    if val is not None:
+                        if m.is_system and target_field == 'status':
+                            tgt_name = None
+                            if isinstance(tgt_val, dict):
+                                tgt_name = tgt_val.get('name') or tgt_val.get('value')
+                            elif isinstance(tgt_val, str):
+                                tgt_name = tgt_val
+                            print(f"    [Status T2S] target status: {tgt_name} -> mapped: {val}")
+                        # Skip no-op updates for simple fields
+                        if self._is_same_value(val, src_fields.get(source_field), m.value_key):
+                            continue
+                        update_fields[source_field] = val
 
         return update_fields
 
+def get_required_fields(mappings: List[Dict], side: str) -> List[str]:
+    """
+    Get the field IDs needed from issues on one side ("source" or "target"),
+    so searches do not have to request all fields.
+    """
+    # Fields used by the sync logic itself (timestamps, status transitions, issue type, attachments)
+    required = ['updated', 'status', 'issuetype', 'attachment']
+    for item in mappings:
+        if item.get('type') == 'system':
+            field_id = item.get('fieldId')
+        else:
+            field_id = item.get('sourceFieldId') if side == 'source' else item.get('targetFieldId')
+        if field_id and field_id not in required:
+            required.append(field_id)
+    return required
+
 def get_customer_issue_id_field_info(mappings: List[Dict]) -> Tuple[Optional[str], Optional[str]]:
     """
     Get customer_issue_id field ID and Name from mapping configuration.
@@ -723,6 +859,44 @@ def get_customer_issue_id_field_info(mappings: List[Dict]) -> Tuple[Optional[str
             return item.get('targetFieldId'), item.get('targetFieldName')
     return None, None
 
+def get_remote_issue_id(issue: Dict, customer_issue_id_field: str):
+    """Get the customer_issue_id value of a target issue (handles option/object value formats)"""
+    remote_val = issue['fields'].get(customer_issue_id_field)
+    if isinstance(remote_val, dict):
+        return remote_val.get('value') or remote_val.get('name')
+    return remote_val
+
+def build_target_map(target_issues: Iterable[Dict], customer_issue_id_field: Optional[str]) -> Tuple[Dict[str, Dict], int]:
+    """
+    Fold target issues into a customer_issue_id -> issue map while they are fetched.
+    Returns (target_map, number of target issues). The map is empty without a customer_issue_id field.
+    """
+    target_map = {}
+    issue_count = 0
+    for t in target_issues:
+        issue_count += 1
+        if customer_issue_id_field:
+            remote_val = get_remote_issue_id(t, customer_issue_id_field)
+            if remote_val:
+                target_map[str(remote_val)] = t
+    return target_map, issue_count
+
+def to_timestamp(value) -> Optional[float]:
+    """Convert a Jira / ISO 8601 datetime string to epoch seconds (values without offset are local time), None if unparsable"""
+    if not isinstance(value, str) or not value:
+        return None
+    # Jira format, e.g. 2024-01-31T10:20:30.123+0800
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt).timestamp()
+        except ValueError:
+            pass
+    # datetime.isoformat() output written by this tool, or a date only
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
 def get_last_sync_time_field(mappings: List[Dict]) -> Optional[str]:
     """Get last_sync_time field ID from mapping configuration"""
     for item in mappings:
@@ -730,11 +904,15 @@ def get_last_sync_time_field(mappings: List[Dict]) -> Optional[str]:
             return item.get('targetFieldId')
     return None
 
+# Attachment filename prefix, format: [PROJECT_KEY] filename
+FILENAME_PREFIX_PATTERN = re.compile(r'^\[[^\]]+\]\s+(.+)$')
+
 def remove_prefix_from_filename(filename: str) -> str:
     """Remove prefix from filename (format: [PROJECT_KEY])"""
-    # Match format: [PROJECT_KEY] filename
-    pattern = r'^\[[^\]]+\]\s+(.+)$'
-    match = re.match(pattern, filename)
+    # Most names have no prefix: skip the regex unless the name starts with '['
+    if not filename.startswith('['):
+        return filename
+    match = FILENAME_PREFIX_PATTERN.match(filename)
     if match:
         return match.group(1)
     return filename
@@ -747,6 +925,13 @@ def get_filename_with_prefix(filename: str, project_key: str) -> str:
     clean_filename = remove_prefix_from_filename(filename)
     return f"{prefix} {clean_filename}"
 
+def get_known_attachments(jira_client: JiraClient, issue: Dict, issue_key: str) -> List[Dict]:
+    """Return the attachment list already fetched with the issue (search requests the attachment field), fetch it only if missing"""
+    fields = issue.get('fields')
+    if fields is not None and 'attachment' in fields:
+        return fields.get('attachment') or []
+    return jira_client.get_issue_attachments(issue_key)
+
 def ensure_local_attachment_dir(target_issue_key: str) -> str:
     """Ensure local attachment directory exists, return directory path"""
     dir_path = target_issue_key
@@ -772,20 +957,29 @@ def download_attachment_to_local(
         return local_path
     return None
 
-def get_local_attachments(local_dir: str) -> List[str]:
+def get_local_attachments(local_dir: str) -> Set[str]:
     """Get all attachment file names in local directory (prefix removed)"""
     if not os.path.exists(local_dir):
-        return []
+        return set()
     
-    attachments = []
-    for filename in os.listdir(local_dir):
-        file_path = os.path.join(local_dir, filename)
-        if os.path.isfile(file_path):
-            # Name after removing prefix
-            clean_name = remove_prefix_from_filename(filename)
-            attachments.append(clean_name)
+    attachments = set()
+    # scandir answers is_file() from the directory listing, without a stat call per entry
+    with os.scandir(local_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                # Name after removing prefix
+                clean_name = remove_prefix_from_filename(entry.name)
+                attachments.add(clean_name)
     return attachments
 
+def get_attachment_names(attachments: List[Dict]) -> Dict[str, str]:
+    """Map attachment names without prefix to their filename (first one wins)"""
+    names = {}
+    for attachment in attachments:
+        filename = attachment.get('filename', '')
+        names.setdefault(remove_prefix_from_filename(filename), filename)
+    return names
+
 def sync_attachments(
     source_issue: Dict,
     target_issue: Dict,
@@ -795,94 +989,82 @@ def sync_attachments(
     source_project_key: str,
     target_project_key: str,
     target_issue_key: str
-):
-    """Sync attachments - MERGE strategy: Ensure both sides have complete attachment union"""
+) -> bool:
+    """
+    Sync attachments - MERGE strategy: Ensure both sides have complete attachment union.
+    Returns False if any attachment could not be downloaded or uploaded.
+    """
     print(f"  -> Syncing attachments (MERGE strategy)...")
     
-    # Ensure local directory exists
-    local_dir = ensure_local_attachment_dir(target_issue_key)
-    
-    # Get attachment lists from source and target (need to re-fetch to ensure latest attachments are included)
-    source_attachments = source_jira.get_issue_attachments(source_issue['key'])
-    target_attachments = target_jira.get_issue_attachments(target_issue_key)
+    # Get attachment lists from source and target: reuse the lists returned by the search
+    # (fetched only if the issue has no attachment field); each upload re-checks the current list below
+    source_attachments = get_known_attachments(source_jira, source_issue, source_issue['key'])
+    target_attachments = get_known_attachments(target_jira, target_issue, target_issue_key)
     
-    # Build attachment map: use filename without prefix as key
-    # For quick lookup of whether attachment exists
-    source_attachment_map = {}  # {clean_name: attachment}
-    target_attachment_map = {}   # {clean_name: attachment}
-    
-    for attachment in source_attachments:
-        filename = attachment.get('filename', '')
-        clean_name = remove_prefix_from_filename(filename)
-        source_attachment_map[clean_name] = attachment
+    # Nothing to merge: skip the local directory work entirely
+    if not source_attachments and not target_attachments:
+        print(f"    No attachments on either side")
+        return True
     
-    for attachment in target_attachments:
-        filename = attachment.get('filename', '')
-        clean_name = remove_prefix_from_filename(filename)
-        target_attachment_map[clean_name] = attachment
+    # Ensure local directory exists
+    local_dir = ensure_local_attachment_dir(target_issue_key)
     
-    # Get locally existing attachments (names without prefix)
-    local_attachments = get_local_attachments(local_dir)
+    # Attachment names without prefix, for quick lookup of whether attachment exists (only membership is needed)
+    source_attachment_names = {remove_prefix_from_filename(a.get('filename', '')) for a in source_attachments}
+    target_attachment_names = {remove_prefix_from_filename(a.get('filename', '')) for a in target_attachments}
     
     # Download all attachments to local (if not already exists)
-    # First get local file list (names without prefix)
-    local_attachments_set = set(local_attachments)
+    # First get locally existing attachments (names without prefix)
+    local_attachments_set = get_local_attachments(local_dir)
     
-    for attachment in source_attachments:
-        filename = attachment.get('filename', '')
-        clean_name = remove_prefix_from_filename(filename)
-        
-        # Check if file already exists locally (compare after removing prefix)
-        if clean_name not in local_attachments_set:
-            print(f"    Downloading Source attachment: {filename}")
-            local_path = download_attachment_to_local(
-                source_jira, attachment, local_dir,
-                source_project_key
-            )
-            if local_path:
-                # After successful download, update local file list
+    # Decide what to download first (source wins for names on both sides), then download concurrently
+    downloads = []  # [(jira_client, attachment, project_key)]
+    for side_name, jira_client, attachments, project_key in (
+        ("Source", source_jira, source_attachments, source_project_key),
+        ("Target", target_jira, target_attachments, target_project_key)
+    ):
+        for attachment in attachments:
+            filename = attachment.get('filename', '')
+            clean_name = remove_prefix_from_filename(filename)
+            
+            # Check if file already exists locally (compare after removing prefix)
+            if clean_name not in local_attachments_set:
+                print(f"    Downloading {side_name} attachment: {filename}")
+                downloads.append((jira_client, attachment, project_key))
                 local_attachments_set.add(clean_name)
-        else:
-            print(f"    Skipping Source attachment download (already exists locally): {filename}")
+            else:
+                print(f"    Skipping {side_name} attachment download (already exists locally): {filename}")
     
-    for attachment in target_attachments:
-        filename = attachment.get('filename', '')
-        clean_name = remove_prefix_from_filename(filename)
-        
-        # Check if file already exists locally (compare after removing prefix)
-        if clean_name not in local_attachments_set:
-            print(f"    Downloading Target attachment: {filename}")
-            local_path = download_attachment_to_local(
-                target_jira, attachment, local_dir,
-                target_project_key
-            )
-            if local_path:
-                # After successful download, update local file list
-                local_attachments_set.add(clean_name)
-        else:
-            print(f"    Skipping Target attachment download (already exists locally): {filename}")
+    success = True
+    if downloads:
+        with ThreadPoolExecutor(max_workers=min(ATTACHMENT_WORKERS, len(downloads))) as executor:
+            futures = [
+                executor.submit(download_attachment_to_local, jira_client, attachment, local_dir, project_key)
+                for jira_client, attachment, project_key in downloads
+            ]
+            # Failures are reported by download_attachment; missing files are reported before upload
+            for future in futures:
+                if future.result() is None:
+                    success = False
     
     # MERGE strategy: Ensure both sides have complete attachment union
     # 1. Upload missing attachments from source to target (filename with [SOURCE_PROJECT_KEY] prefix)
+    target_uploads = []  # [(local_path, upload_name)]
+    target_upload_names = set()
+    current_target_names = None  # Current target attachments, re-fetched once when the first missing attachment is found
     for attachment in source_attachments:
         filename = attachment.get('filename', '')
         clean_name = remove_prefix_from_filename(filename)
         
         # Check if target already has this attachment (compare after removing prefix)
-        if clean_name not in target_attachment_map:
+        # (skip names already queued for upload in this pass)
+        if clean_name not in target_attachment_names and clean_name not in target_upload_names:
             # Before uploading, check again if target issue already has this attachment (may have been added during upload process)
-            # Re-fetch target issue attachment list
-            current_target_attachments = target_jira.get_issue_attachments(target_issue_key)
-            target_has_file = False
-            for t_att in current_target_attachments:
-                t_filename = t_att.get('filename', '')
-                t_clean_name = remove_prefix_from_filename(t_filename)
-                if t_clean_name == clean_name:
-                    target_has_file = True
-                    print(f"    Skipping Source attachment upload to Target (target already exists): {filename} (target has: {t_filename})")
-                    break
-            
-            if target_has_file:
+            # Re-fetch target issue attachment list (once per pass, nothing is uploaded until after the loop)
+            if current_target_names is None:
+                current_target_names = get_attachment_names(target_jira.get_issue_attachments(target_issue_key))
+            if clean_name in current_target_names:
+                print(f"    Skipping Source attachment upload to Target (target already exists): {filename} (target has: {current_target_names[clean_name]})")
                 continue
             
             # Get file from local (with project key prefix)
@@ -891,63 +1073,41 @@ def sync_attachments(
             
             if os.path.exists(local_path):
                 # Upload to target, filename with [SOURCE_PROJECT_KEY] prefix
+                # (the upload name is set in the request, so the local file is never copied)
                 prefixed_filename = get_filename_with_prefix(filename, source_project_key)
                 print(f"    Uploading attachment to Target: {prefixed_filename}")
                 
-                # If local file already has correct prefix filename, use it directly
-                # Otherwise create temporary file
-                if os.path.basename(local_path) == prefixed_filename:
-                    # Filename same, use local file directly
-                    upload_path = local_path
-                else:
-                    # Create temporary file with prefixed filename
-                    import shutil
-                    import tempfile
-                    # Use system temp directory to avoid file locking issues
-                    temp_dir = tempfile.gettempdir()
-                    temp_path = os.path.join(temp_dir, prefixed_filename)
-                    try:
-                        shutil.copy2(local_path, temp_path)
-                        upload_path = temp_path
-                    except PermissionError as e:
-                        print(f"    Warning: Cannot copy file (may be used by another process): {str(e)}")
-                        # Try to use local file directly
-                        upload_path = local_path
-                    except Exception as e:
-                        print(f"    Error: Error occurred while copying file: {str(e)}")
-                        continue
-                
-                # Upload attachment
-                if target_jira.upload_attachment(target_issue_key, upload_path):
-                    # If temporary file was used, delete it
-                    if upload_path != local_path and os.path.exists(upload_path):
-                        try:
-                            os.remove(upload_path)
-                        except Exception as e:
-                            print(f"    Warning: Cannot delete temporary file: {str(e)}")
+                # Uploaded together after the loop
+                target_uploads.append((local_path, prefixed_filename))
+                target_upload_names.add(clean_name)
             else:
                 print(f"    Warning: Local file does not exist, cannot upload: {local_path}")
+                success = False
+    
+    # Upload all missing attachments in one request
+    if target_uploads:
+        failed_uploads = target_jira.upload_attachments(target_issue_key, target_uploads)
+        if failed_uploads:
+            print(f"    Warning: Failed to upload attachments to Target: {failed_uploads}")
+            success = False
     
     # 2. Upload missing attachments from target to source (filename with [TARGET_PROJECT_KEY] prefix)
+    source_uploads = []  # [(local_path, upload_name)]
+    source_upload_names = set()
+    current_source_names = None  # Current source attachments, re-fetched once when the first missing attachment is found
     for attachment in target_attachments:
         filename = attachment.get('filename', '')
         clean_name = remove_prefix_from_filename(filename)
         
         # Check if source already has this attachment (compare after removing prefix)
-        if clean_name not in source_attachment_map:
+        # (skip names already queued for upload in this pass)
+        if clean_name not in source_attachment_names and clean_name not in source_upload_names:
             # Before uploading, check again if source issue already has this attachment (may have been added during upload process)
-            # Re-fetch source issue attachment list
-            current_source_attachments = source_jira.get_issue_attachments(source_issue['key'])
-            source_has_file = False
-            for s_att in current_source_attachments:
-                s_filename = s_att.get('filename', '')
-                s_clean_name = remove_prefix_from_filename(s_filename)
-                if s_clean_name == clean_name:
-                    source_has_file = True
-                    print(f"    Skipping Target attachment upload to Source (target already exists): {filename} (target has: {s_filename})")
-                    break
-            
-            if source_has_file:
+            # Re-fetch source issue attachment list (once per pass, nothing is uploaded until after the loop)
+            if current_source_names is None:
+                current_source_names = get_attachment_names(source_jira.get_issue_attachments(source_issue['key']))
+            if clean_name in current_source_names:
+                print(f"    Skipping Target attachment upload to Source (target already exists): {filename} (target has: {current_source_names[clean_name]})")
                 continue
             
             # Get file from local (with project key prefix)
@@ -956,42 +1116,332 @@ def sync_attachments(
             
             if os.path.exists(local_path):
                 # Upload to source, filename with [TARGET_PROJECT_KEY] prefix
+                # (the upload name is set in the request, so the local file is never copied)
                 prefixed_filename = get_filename_with_prefix(filename, target_project_key)
                 print(f"    Uploading attachment to Source: {prefixed_filename}")
                 
-                # If local file already has correct prefix filename, use it directly
-                # Otherwise create temporary file
-                if os.path.basename(local_path) == prefixed_filename:
-                    # Filename same, use local file directly
-                    upload_path = local_path
+                # Uploaded together after the loop
+                source_uploads.append((local_path, prefixed_filename))
+                source_upload_names.add(clean_name)
+            else:
+                print(f"    Warning: Local file does not exist, cannot upload: {local_path}")
+                success = False
+    
+    # Upload all missing attachments in one request
+    if source_uploads:
+        failed_uploads = source_jira.upload_attachments(source_issue['key'], source_uploads)
+        if failed_uploads:
+            print(f"    Warning: Failed to upload attachments to Source: {failed_uploads}")
+            success = False
+    
+    return success
+
+def sync_issue(s_issue, target_map, processor, source_jira, target_jira,
+               source_project_key, target_project_key, customer_issue_id_field, last_sync_time_field):
+    """
+    Synchronize a single source issue (create or update its target issue).
+    Returns "created", "updated", "skipped", "failed" if a transition, field update or attachment
+    transfer failed, or None if creation failed.
+    """
+    s_key = s_issue['key']
+    print(f"Processing: {s_key}")
+
+    if s_key not in target_map:
+        # Create
+        print("  -> Creating new Target Issue...")
+        # Get issue type
+        if DEBUG_MODE:
+            # Debug mode: use Bug type to create target issue
+            issue_type = "Bug"
+            print(f"  [DEBUG MODE] Using Bug type to create Target Issue")
+        else:
+            # Production mode: get issue type from source issue or use default
+            issue_type = s_issue['fields'].get('issuetype', {}).get('name', 'Bug')
+        
+        payload = processor.prepare_create_payload(
+            s_issue, 
+            target_project_key, 
+            issue_type,
+            customer_issue_id_field
+        )
+        new_key = target_jira.create_issue(payload)
+        if new_key:
+            # Immediately update SYNC_METADATA and STATIC_VALUE fields after creation
+            post_create_fields = {}
+            
+            # Update SYNC_METADATA fields (customer_issue_id and last_sync_time)
+            if customer_issue_id_field:
+                # Find corresponding config item to get field type
+                customer_issue_id_config = processor.metadata_configs.get(('customer_issue_id', customer_issue_id_field))
+                
+                # Format field value
+                if customer_issue_id_config:
+                    formatted_value = processor.format_field_value(s_key, customer_issue_id_config)
+                    post_create_fields[customer_issue_id_field] = formatted_value
+                else:
+                    post_create_fields[customer_issue_id_field] = s_key
+            
+            if last_sync_time_field:
+                current_time = datetime.now().isoformat()
+                # Find corresponding config item to get field type
+                last_sync_time_config = processor.metadata_configs.get(('last_sync_time', last_sync_time_field))
+                
+                # Format field value
+                if last_sync_time_config:
+                    formatted_value = processor.format_field_value(current_time, last_sync_time_config)
+                    post_create_fields[last_sync_time_field] = formatted_value
                 else:
-                    # Create temporary file with prefixed filename
-                    import shutil
-                    import tempfile
-                    # Use system temp directory to avoid file locking issues
-                    temp_dir = tempfile.gettempdir()
-                    temp_path = os.path.join(temp_dir, prefixed_filename)
+                    post_create_fields[last_sync_time_field] = current_time
+            
+            # Update STATIC_VALUE fields (triggered on CREATE, formatted once by FieldProcessor)
+            post_create_fields.update(processor.static_create_fields)
+            
+            if post_create_fields:
+                print(f"  -> Updating metadata and static value fields...")
+                url = f"{target_jira.base_url}/issue/{new_key}"
+                successful_fields = {}
+                failed_fields = {}
+                # Try all fields in one request first
+                response = target_jira.session.put(url, json={"fields": post_create_fields})
+                if response.status_code == 204:
+                    print(f"  [Updated] {new_key} fields updated.")
+                    fields_to_probe = {}
+                else:
+                    fields_to_probe = post_create_fields
+                    # Jira names the rejected fields in "errors": drop them and retry the rest once
+                    try:
+                        field_errors = response.json().get('errors') or {}
+                    except ValueError:
+                        field_errors = {}
+                    if field_errors and all(field_id in post_create_fields for field_id in field_errors):
+                        failed_fields = {field_id: str(error_msg) for field_id, error_msg in field_errors.items()}
+                        remaining_fields = {k: v for k, v in post_create_fields.items() if k not in failed_fields}
+                        if not remaining_fields:
+                            fields_to_probe = {}
+                        elif target_jira.session.put(url, json={"fields": remaining_fields}).status_code == 204:
+                            successful_fields = remaining_fields
+                            fields_to_probe = {}
+                        else:
+                            fields_to_probe = remaining_fields
+                # Only if that is still rejected: update fields separately, skip fields that cannot be set
+                
+                for field_id, field_value in fields_to_probe.items():
                     try:
-                        shutil.copy2(local_path, temp_path)
-                        upload_path = temp_path
-                    except PermissionError as e:
-                        print(f"    Warning: Cannot copy file (may be used by another process): {str(e)}")
-                        # Try to use local file directly
-                        upload_path = local_path
+                        # Try to update each field separately
+                        test_update = {field_id: field_value}
+                        payload = {"fields": test_update}
+                        response = target_jira.session.put(url, json=payload)
+                        
+                        if response.status_code == 204:
+                            successful_fields[field_id] = field_value
+                        else:
+                            # Parse error response
+                            error_msg = response.text
+                            try:
+                                error_json = response.json()
+                                if 'errors' in error_json:
+                                    error_details = error_json['errors'].get(field_id, 'Unknown error')
+                                    error_msg = f"{error_details}"
+                                elif 'errorMessages' in error_json:
+                                    error_msg = '; '.join(error_json['errorMessages'])
+                            except:
+                                pass
+                            
+                            failed_fields[field_id] = error_msg
+                            print(f"    Warning: Cannot set field {field_id}: {response.status_code}")
+                            print(f"    Error details: {error_msg}")
+                            print(f"    Attempted value: {json.dumps(field_value, ensure_ascii=False)}")
                     except Exception as e:
-                        print(f"    Error: Error occurred while copying file: {str(e)}")
-                        continue
+                        failed_fields[field_id] = str(e)
+                        print(f"    Warning: Error occurred while setting field {field_id}: {str(e)}")
+                        print(f"    Attempted value: {json.dumps(field_value, ensure_ascii=False)}")
                 
-                # Upload attachment
-                if source_jira.upload_attachment(source_issue['key'], upload_path):
-                    # If temporary file was used, delete it
-                    if upload_path != local_path and os.path.exists(upload_path):
-                        try:
-                            os.remove(upload_path)
-                        except Exception as e:
-                            print(f"    Warning: Cannot delete temporary file: {str(e)}")
-            else:
-                print(f"    Warning: Local file does not exist, cannot upload: {local_path}")
+                # Fields that succeeded (individually or in the retry) are already set
+                if successful_fields:
+                    print(f"  [Updated] {new_key} fields updated: {list(successful_fields.keys())}")
+                
+                # If there are failed fields, log warning
+                if failed_fields:
+                    print(f"    Warning: The following fields cannot be set: {list(failed_fields.keys())}")
+                    print(f"    These fields may not be on the current issue type's edit screen, or the value format is incorrect")
+                    # Display detailed error for each failed field
+                    for field_id, error_msg in failed_fields.items():
+                        print(f"      - {field_id}: {error_msg[:200]}")
+            
+            # Sync attachments to newly created issue (using MERGE strategy)
+            # Create a target_issue object with only key and its (empty) attachment list: a new issue has no attachments yet
+            new_target_issue = {'key': new_key, 'fields': {'attachment': []}}
+            if not sync_attachments(
+                s_issue, new_target_issue, "S2T",
+                source_jira, target_jira,
+                source_project_key, target_project_key,
+                new_key
+            ):
+                return "failed"
+            return "created"
+        return None
+    else:
+        # Update
+        t_issue = target_map[s_key]
+        t_key = t_issue['key']
+        print(f"  -> Found matching Target Issue: {t_key}")
+
+        # Simplified update logic: use last_sync_time as baseline
+        s_time = s_issue['fields'].get('updated', '')
+        t_time = t_issue['fields'].get('updated', '')
+        
+        # Get last_sync_time
+        last_sync_time = None
+        if last_sync_time_field:
+            last_sync_time = t_issue['fields'].get(last_sync_time_field)
+            if isinstance(last_sync_time, dict):
+                last_sync_time = last_sync_time.get('value')
+        
+        # Compare as timestamps so values with different UTC offsets are ordered correctly
+        # (parsed once per issue); fall back to comparing the raw strings if any value is unparsable
+        last_sync_cmp = last_sync_time
+        parsed = [to_timestamp(v) for v in (s_time, t_time, last_sync_time)]
+        if None not in parsed[:2] and (parsed[2] is not None or not last_sync_time):
+            s_time, t_time = parsed[0], parsed[1]
+            last_sync_cmp = parsed[2]
+        
+        # If both issues' updated time are earlier than last_sync_time, no need to update fields
+        # But attachment MERGE sync still needs to be executed
+        if last_sync_time and s_time <= last_sync_cmp and t_time <= last_sync_cmp:
+            print(f"  -> Skipping field update (no changes since last sync, last_sync_time: {last_sync_time})")
+            # Even if fields have no changes, execute attachment MERGE sync
+            if not sync_attachments(
+                s_issue, t_issue, "NONE",
+                source_jira, target_jira,
+                source_project_key, target_project_key,
+                t_key
+            ):
+                return "failed"
+            return "skipped"
+        
+        # Otherwise (or on first sync without last_sync_time), the newer side wins
+        if s_time > t_time:
+            direction = "S2T"
+        elif t_time > s_time:
+            direction = "T2S"
+        else:
+            direction = "NONE"
+
+        if direction == "NONE":
+            print("  -> Skipping field update (times are same)")
+            # Even if times are same, execute attachment MERGE sync
+            if not sync_attachments(
+                s_issue, t_issue, direction,
+                source_jira, target_jira,
+                source_project_key, target_project_key,
+                t_key
+            ):
+                return "failed"
+            return "skipped"
+
+        # Debug: print current status on both sides before preparing updates
+        def _get_status_name(issue_obj):
+            st = issue_obj.get('fields', {}).get('status')
+            if isinstance(st, dict):
+                return st.get('name') or st.get('value')
+            if isinstance(st, str):
+                return st
+            return None
+
+        s_status_name = _get_status_name(s_issue)
+        t_status_name = _get_status_name(t_issue)
+        print(f"    Current status (Source): {s_status_name}")
+        print(f"    Current status (Target): {t_status_name}")
+
+        # Prepare update fields
+        update_fields = processor.prepare_update_payload(
+            s_issue,
+            t_issue,
+            direction,
+            customer_issue_id_field,
+            last_sync_time_field
+        )
+
+        updated = False
+        # Set when a transition or field update is rejected, so the run does not advance the sync cursor
+        failed = False
+        if update_fields:
+            print(f"  -> Updating {t_key if direction == 'S2T' else s_key} ({direction})...")
+            # Handle status via transition API; others via field update
+            status_val = update_fields.pop("status", None)
+            if status_val:
+                status_name = None
+                if isinstance(status_val, dict):
+                    status_name = status_val.get("name") or status_val.get("value")
+                elif isinstance(status_val, str):
+                    status_name = status_val
+                print(f"    Status to transition: {status_name}")
+            # Only print status; skip printing custom field updates
+            if direction == "S2T":
+                if status_val:
+                    if status_name and not target_jira.transition_issue(t_key, status_name):
+                        failed = True
+                if update_fields and not target_jira.update_issue(t_key, update_fields):
+                    failed = True
+                updated = True
+            elif direction == "T2S":
+                if status_val:
+                    if status_name and not source_jira.transition_issue(s_key, status_name):
+                        failed = True
+                if update_fields and not source_jira.update_issue(s_key, update_fields):
+                    failed = True
+                updated = True
+        else:
+            print("  -> No fields to update")
+        
+        # Sync attachments (MERGE strategy: execute attachment sync regardless of whether fields are updated)
+        if not sync_attachments(
+            s_issue, t_issue, direction,
+            source_jira, target_jira,
+            source_project_key, target_project_key,
+            t_key
+        ):
+            failed = True
+        
+        if failed:
+            return "failed"
+        return "updated" if updated else "skipped"
+
+def load_last_sync_ts() -> Optional[float]:
+    """Read the start time (epoch seconds) of the last successful run from STATE_FILE"""
+    if not os.path.exists(STATE_FILE):
+        return None
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return float(json.load(f).get('last_sync_ts'))
+    except Exception as e:
+        print(f"  Warning: Cannot read {STATE_FILE}, running full sync: {str(e)}")
+        return None
+
+def get_target_changed_source_keys(target_map: Dict[str, Dict], since_ts: float, source_project_key: str) -> List[str]:
+    """
+    Source issue keys (customer_issue_id) of target issues updated since since_ts, so changes made only
+    on the target side (T2S fields, target attachments) are picked up by an incremental sync.
+    """
+    key_prefix = f"{source_project_key}-"
+    changed_keys = []
+    for s_key, t_issue in target_map.items():
+        # Only keys of the source project can be queried with "key in (...)"
+        if not s_key.startswith(key_prefix):
+            continue
+        t_updated = to_timestamp(t_issue['fields'].get('updated'))
+        # Unparsable timestamps are treated as changed
+        if t_updated is None or t_updated >= since_ts:
+            changed_keys.append(s_key)
+    return changed_keys
+
+def save_last_sync_ts(ts: float):
+    """Persist the start time of a successful run to STATE_FILE"""
+    try:
+        with open(STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'last_sync_ts': ts}, f)
+    except Exception as e:
+        print(f"  Warning: Cannot write {STATE_FILE}: {str(e)}")
 
 def run_sync():
     """Execute synchronization process"""
@@ -1005,6 +1455,9 @@ def run_sync():
     print("=" * 80)
     print()
 
+    # Taken before searching, so issues changed while this run is in progress are picked up next time
+    run_started_ts = time.time()
+
     # Read field mapping configuration
     if not os.path.exists(MAPPING_FILE):
         raise FileNotFoundError(f"Error: Cannot find {MAPPING_FILE}")
@@ -1056,27 +1509,25 @@ def run_sync():
         issue_type_filter = " OR ".join([f'issuetype = "{it}"' for it in sync_issue_types])
         jql_parts.append(f"({issue_type_filter})")
     
+    last_sync_ts = None
+    incremental_filter = None
     if DEBUG_MODE:
         jql_parts.append("updated >= -1d")  # Updated in last 1 day
+    elif incremental_sync:
+        last_sync_ts = load_last_sync_ts()
+        if last_sync_ts:
+            # Relative JQL avoids Jira user timezone conversion; +1 minute margin covers minute granularity
+            minutes = int((run_started_ts - last_sync_ts) // 60) + 1
+            incremental_filter = f"updated >= -{minutes}m"
+            print(f"  Incremental sync: issues updated in the last {minutes} minute(s) on either side")
     
     # Build JQL: join conditions with AND, add ORDER BY separately
     source_jql = " AND ".join(jql_parts) + " ORDER BY updated DESC"
-    print(f"  JQL: {source_jql}")
-    
-    source_issues = source_jira.search_issues(source_jql)
-    print(f"  Found {len(source_issues)} Source Issues")
-    
-    # Debug mode: only process specified issue key
-    if DEBUG_MODE:
-        debug_issue_key = f"{source_project_key}-27979"
-        print(f"  [DEBUG MODE] Filtering to only process issue key: {debug_issue_key}")
-        filtered_issues = [issue for issue in source_issues if issue.get('key') == debug_issue_key]
-        if filtered_issues:
-            source_issues = filtered_issues
-            print(f"  Found matching Debug Issue: {debug_issue_key}")
-        else:
-            print(f"  Warning: Issue key {debug_issue_key} not found, will process all found issues")
-    
+    if incremental_filter:
+        # The time filter (plus issues changed on the target side) is added once the target issues are known
+        print(f"  JQL (without incremental filter): {source_jql}")
+    else:
+        print(f"  JQL: {source_jql}")
     print()
 
     # 2. Get Target Issues (based on customer_issue_id field)
@@ -1092,296 +1543,100 @@ def run_sync():
         target_jql = f"project = {target_project_key}"
     
     print(f"  JQL: {target_jql}")
-    target_issues = target_jira.search_issues(target_jql)
-    print(f"  Found {len(target_issues)} Target Issues")
     print()
 
-    # 3. Build Lookup Map (based on customer_issue_id)
-    target_map = {}
-    for t in target_issues:
-        if customer_issue_id_field:
-            remote_val = t['fields'].get(customer_issue_id_field)
-            # Handle different value formats
-            if isinstance(remote_val, dict):
-                remote_val = remote_val.get('value') or remote_val.get('name')
-            if remote_val:
-                target_map[str(remote_val)] = t
+    source_fields = get_required_fields(mappings, 'source')
+    target_fields = get_required_fields(mappings, 'target')
+    if incremental_filter:
+        # Incremental sync: the target issues are needed first, since source issues whose target
+        # was changed since the last run must be synced too, even if the source issue itself was not
+        target_map, target_issue_count = build_target_map(
+            target_jira.iter_issues(target_jql, fields=target_fields),
+            customer_issue_id_field
+        )
+        # Same 1 minute margin as the relative JQL filter
+        target_changed_keys = get_target_changed_source_keys(target_map, last_sync_ts - 60, source_project_key)
+        if target_changed_keys:
+            print(f"  Incremental sync: {len(target_changed_keys)} issue(s) changed on the target side")
+            key_filter = ", ".join(target_changed_keys)
+            incremental_filter = f"({incremental_filter} OR key in ({key_filter}))"
+        incremental_jql = " AND ".join(jql_parts + [incremental_filter]) + " ORDER BY updated DESC"
+        print(f"  Source JQL: {incremental_jql}")
+        try:
+            source_issues = source_jira.search_issues(incremental_jql, fields=source_fields)
+        except requests.exceptions.HTTPError as e:
+            # e.g. a customer_issue_id pointing to a deleted source issue makes "key in (...)" invalid
+            print(f"  Warning: Incremental source search failed, running full sync: {str(e)}")
+            source_issues = source_jira.search_issues(source_jql, fields=source_fields)
+    else:
+        # The source and target searches are independent, so they run concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(source_jira.search_issues, source_jql, fields=source_fields)
+            # Target pages are folded into the lookup map (based on customer_issue_id) as they arrive,
+            # without keeping an intermediate list of all target issues
+            target_future = executor.submit(
+                build_target_map,
+                target_jira.iter_issues(target_jql, fields=target_fields),
+                customer_issue_id_field
+            )
+            source_issues = source_future.result()
+            target_map, target_issue_count = target_future.result()
+
+    print(f"  Found {len(source_issues)} Source Issues")
+    
+    # Debug mode: only process specified issue key
+    if DEBUG_MODE:
+        debug_issue_key = f"{source_project_key}-27979"
+        print(f"  [DEBUG MODE] Filtering to only process issue key: {debug_issue_key}")
+        filtered_issues = [issue for issue in source_issues if issue.get('key') == debug_issue_key]
+        if filtered_issues:
+            source_issues = filtered_issues
+            print(f"  Found matching Debug Issue: {debug_issue_key}")
         else:
-            # If no customer_issue_id field, cannot build mapping
-            pass
+            print(f"  Warning: Issue key {debug_issue_key} not found, will process all found issues")
+    
+    print(f"  Found {target_issue_count} Target Issues")
+    print()
 
-    # 4. Execute synchronization
+    # 3. Execute synchronization
     print("[3] Executing synchronization...")
     print()
     
     created_count = 0
     updated_count = 0
     skipped_count = 0
+    failed_count = 0
     
-    for s_issue in source_issues:
-        s_key = s_issue['key']
-        print(f"Processing: {s_key}")
-
-        if s_key not in target_map:
-            # Create
-            print("  -> Creating new Target Issue...")
-            # Get issue type
-            if DEBUG_MODE:
-                # Debug mode: use Bug type to create target issue
-                issue_type = "Bug"
-                print(f"  [DEBUG MODE] Using Bug type to create Target Issue")
-            else:
-                # Production mode: get issue type from source issue or use default
-                issue_type = s_issue['fields'].get('issuetype', {}).get('name', 'Bug')
-            
-            payload = processor.prepare_create_payload(
-                s_issue, 
-                target_project_key, 
-                issue_type,
-                customer_issue_id_field
-            )
-            new_key = target_jira.create_issue(payload)
-            if new_key:
-                created_count += 1
-                
-                # Immediately update SYNC_METADATA and STATIC_VALUE fields after creation
-                post_create_fields = {}
-                
-                # Update SYNC_METADATA fields (customer_issue_id and last_sync_time)
-                if customer_issue_id_field:
-                    # Find corresponding config item to get field type
-                    customer_issue_id_config = None
-                    for item in mappings:
-                        if (item.get('strategy') == 'SYNC_METADATA' and 
-                            item.get('metadataType') == 'customer_issue_id' and
-                            item.get('targetFieldId') == customer_issue_id_field):
-                            customer_issue_id_config = item
-                            break
-                    
-                    # Format field value
-                    if customer_issue_id_config:
-                        formatted_value = processor.format_field_value(s_key, customer_issue_id_config)
-                        post_create_fields[customer_issue_id_field] = formatted_value
-                    else:
-                        post_create_fields[customer_issue_id_field] = s_key
-                
-                if last_sync_time_field:
-                    current_time = datetime.now().isoformat()
-                    # Find corresponding config item to get field type
-                    last_sync_time_config = None
-                    for item in mappings:
-                        if (item.get('strategy') == 'SYNC_METADATA' and 
-                            item.get('metadataType') == 'last_sync_time' and
-                            item.get('targetFieldId') == last_sync_time_field):
-                            last_sync_time_config = item
-                            break
-                    
-                    # Format field value
-                    if last_sync_time_config:
-                        formatted_value = processor.format_field_value(current_time, last_sync_time_config)
-                        post_create_fields[last_sync_time_field] = formatted_value
-                    else:
-                        post_create_fields[last_sync_time_field] = current_time
-                
-                # Update STATIC_VALUE fields (triggered on CREATE)
-                for item in mappings:
-                    if item.get('strategy') == 'STATIC_VALUE':
-                        trigger_on = item.get('triggerOn', item.get('trigger_on', ['CREATE', 'UPDATE']))
-                        if 'CREATE' in trigger_on:
-                            static_value = item.get('staticValue', item.get('static_value', {}))
-                            target_field_id = item.get('targetFieldId')
-                            if target_field_id:
-                                # Extract actual value
-                                if isinstance(static_value, dict):
-                                    actual_value = static_value.get('value', static_value)
-                                else:
-                                    actual_value = static_value
-                                
-                                # Use format_field_value to format field value
-                                formatted_value = processor.format_field_value(actual_value, item)
-                                post_create_fields[target_field_id] = formatted_value
-                
-                if post_create_fields:
-                    print(f"  -> Updating metadata and static value fields...")
-                    # Update fields separately, skip fields that cannot be set
-                    successful_fields = {}
-                    failed_fields = {}
-                    
-                    for field_id, field_value in post_create_fields.items():
-                        try:
-                            # Try to update each field separately
-                            test_update = {field_id: field_value}
-                            url = f"{target_jira.base_url}/issue/{new_key}"
-                            payload = {"fields": test_update}
-                            response = requests.put(url, headers=target_jira.headers, json=payload)
-                            
-                            if response.status_code == 204:
-                                successful_fields[field_id] = field_value
-                            else:
-                                # Parse error response
-                                error_msg = response.text
-                                try:
-                                    error_json = response.json()
-                                    if 'errors' in error_json:
-                                        error_details = error_json['errors'].get(field_id, 'Unknown error')
-                                        error_msg = f"{error_details}"
-                                    elif 'errorMessages' in error_json:
-                                        error_msg = '; '.join(error_json['errorMessages'])
-                                except:
-                                    pass
-                                
-                                failed_fields[field_id] = error_msg
-                                print(f"    Warning: Cannot set field {field_id}: {response.status_code}")
-                                print(f"    Error details: {error_msg}")
-                                print(f"    Attempted value: {json.dumps(field_value, ensure_ascii=False)}")
-                        except Exception as e:
-                            failed_fields[field_id] = str(e)
-                            print(f"    Warning: Error occurred while setting field {field_id}: {str(e)}")
-                            print(f"    Attempted value: {json.dumps(field_value, ensure_ascii=False)}")
-                    
-                    # If there are successful fields, batch update
-                    if successful_fields:
-                        target_jira.update_issue(new_key, successful_fields)
-                    
-                    # If there are failed fields, log warning
-                    if failed_fields:
-                        print(f"    Warning: The following fields cannot be set: {list(failed_fields.keys())}")
-                        print(f"    These fields may not be on the current issue type's edit screen, or the value format is incorrect")
-                        # Display detailed error for each failed field
-                        for field_id, error_msg in failed_fields.items():
-                            print(f"      - {field_id}: {error_msg[:200]}")
-                
-                # Sync attachments to newly created issue (using MERGE strategy)
-                # Create a target_issue object with only key (sync_attachments function does not use other fields of this parameter)
-                new_target_issue = {'key': new_key}
-                sync_attachments(
-                    s_issue, new_target_issue, "S2T",
-                    source_jira, target_jira,
-                    source_project_key, target_project_key,
-                    new_key
-                )
-        else:
-            # Update
-            t_issue = target_map[s_key]
-            t_key = t_issue['key']
-            print(f"  -> Found matching Target Issue: {t_key}")
-
-            # Simplified update logic: use last_sync_time as baseline
-            s_time = s_issue['fields'].get('updated', '')
-            t_time = t_issue['fields'].get('updated', '')
-            
-            # Get last_sync_time
-            last_sync_time = None
-            if last_sync_time_field:
-                last_sync_time = t_issue['fields'].get(last_sync_time_field)
-                if isinstance(last_sync_time, dict):
-                    last_sync_time = last_sync_time.get('value')
-            
-            direction = "NONE"
-            
-            if last_sync_time:
-                # If both issues' updated time are earlier than last_sync_time, no need to update fields
-                # But attachment MERGE sync still needs to be executed
-                if s_time <= last_sync_time and t_time <= last_sync_time:
-                    print(f"  -> Skipping field update (no changes since last sync, last_sync_time: {last_sync_time})")
-                    # Even if fields have no changes, execute attachment MERGE sync
-                    sync_attachments(
-                        s_issue, t_issue, "NONE",
-                        source_jira, target_jira,
-                        source_project_key, target_project_key,
-                        t_key
-                    )
-                    skipped_count += 1
-                    continue
-                
-                # Otherwise, compare two times to determine direction
-                if s_time > t_time:
-                    direction = "S2T"
-                elif t_time > s_time:
-                    direction = "T2S"
-            else:
-                # No last_sync_time (first sync), use original logic
-                if s_time > t_time:
-                    direction = "S2T"
-                elif t_time > s_time:
-                    direction = "T2S"
-
-            if direction == "NONE":
-                print("  -> Skipping field update (times are same)")
-                # Even if times are same, execute attachment MERGE sync
-                sync_attachments(
-                    s_issue, t_issue, direction,
-                    source_jira, target_jira,
-                    source_project_key, target_project_key,
-                    t_key
-                )
-                skipped_count += 1
-                continue
-
-            # Debug: print current status on both sides before preparing updates
-            def _get_status_name(issue_obj):
-                st = issue_obj.get('fields', {}).get('status')
-                if isinstance(st, dict):
-                    return st.get('name') or st.get('value')
-                if isinstance(st, str):
-                    return st
-                return None
-
-            s_status_name = _get_status_name(s_issue)
-            t_status_name = _get_status_name(t_issue)
-            print(f"    Current status (Source): {s_status_name}")
-            print(f"    Current status (Target): {t_status_name}")
-
-            # Prepare update fields
-            update_fields = processor.prepare_update_payload(
-                s_issue,
-                t_issue,
-                direction,
-                customer_issue_id_field,
-                last_sync_time_field
-            )
-
-            if update_fields:
-                print(f"  -> Updating {t_key if direction == 'S2T' else s_key} ({direction})...")
-                # Handle status via transition API; others via field update
-                status_val = update_fields.pop("status", None)
-                if status_val:
-                    status_name = None
-                    if isinstance(status_val, dict):
-                        status_name = status_val.get("name") or status_val.get("value")
-                    elif isinstance(status_val, str):
-                        status_name = status_val
-                    print(f"    Status to transition: {status_name}")
-                # Only print status; skip printing custom field updates
-                if direction == "S2T":
-                    if status_val:
-                        if status_name:
-                            target_jira.transition_issue(t_key, status_name)
-                    if update_fields:
-                        target_jira.update_issue(t_key, update_fields)
-                    updated_count += 1
-                elif direction == "T2S":
-                    if status_val:
-                        if status_name:
-                            source_jira.transition_issue(s_key, status_name)
-                    if update_fields:
-                        source_jira.update_issue(s_key, update_fields)
-                    updated_count += 1
-            else:
-                print("  -> No fields to update")
-            
-            # Sync attachments (MERGE strategy: execute attachment sync regardless of whether fields are updated)
-            sync_attachments(
-                s_issue, t_issue, direction,
+    # Issues are independent once target_map is built, so they are processed
+    # concurrently (network-bound; configurable with syncWorkers)
+    with ThreadPoolExecutor(max_workers=max(1, sync_workers)) as executor:
+        futures = {
+            executor.submit(
+                sync_issue, s_issue, target_map, processor,
                 source_jira, target_jira,
                 source_project_key, target_project_key,
-                t_key
-            )
-            
-            if not update_fields:
+                customer_issue_id_field, last_sync_time_field
+            ): s_issue['key']
+            for s_issue in source_issues
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  [Error] Failed to sync {futures[future]}: {str(e)}")
+                failed_count += 1
+                continue
+            if result == "created":
+                created_count += 1
+            elif result == "updated":
+                updated_count += 1
+            elif result == "skipped":
                 skipped_count += 1
+            else:
+                # Creation failed, or a transition / field update / attachment transfer failed
+                failed_count += 1
 
-    # 5. Display synchronization results
+    # 4. Display synchronization results
     print()
     print("=" * 80)
     print("Synchronization Results Summary")
@@ -1390,7 +1645,13 @@ def run_sync():
     print(f"Created Target Issues: {created_count}")
     print(f"Updated Issues: {updated_count}")
     print(f"Skipped Issues: {skipped_count}")
+    if failed_count:
+        print(f"Failed Issues: {failed_count}")
     print("=" * 80)
 
+    # Only advance the cursor when every issue went through, otherwise failed issues would be skipped next run
+    if incremental_sync and not DEBUG_MODE and not failed_count:
+        save_last_sync_ts(run_started_ts)
+
 if __name__ == "__main__":
     run_sync()
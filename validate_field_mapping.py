@@ -6,12 +6,16 @@ import requests
 import json
 import os
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Set, Dict, Tuple
 
 # Configuration file paths
 CONFIG_FILE = "jira_config.json"
 MAPPING_FILE = "jira_field_mapping.json"
 
+# Headers depend only on fixed config values; cache them instead of re-encoding per request (callers must not mutate the returned dict)
+@lru_cache(maxsize=4)
 def get_auth_headers(auth_type: str, api_token: str, email: str = None) -> Dict:
     """Generate authentication headers based on authType"""
     if auth_type == "Basic":
@@ -107,14 +111,9 @@ def validate_fields(
     jira_name: str
 ) -> Tuple[List[str], List[str]]:
     """Validate if field IDs exist"""
-    valid_fields = []
-    invalid_fields = []
-    
-    for field_id in field_ids:
-        if field_id in available_fields:
-            valid_fields.append(field_id)
-        else:
-            invalid_fields.append(field_id)
+    # Keep mapping order (and duplicates) so the report lists fields as they appear in the mapping file
+    valid_fields = [field_id for field_id in field_ids if field_id in available_fields]
+    invalid_fields = [field_id for field_id in field_ids if field_id not in available_fields]
     
     return valid_fields, invalid_fields
 
@@ -167,15 +166,6 @@ def main():
     print(f"  Source URL: {source_base_url}")
     print(f"  Auth Type: {source_auth_type}")
     
-    source_available_fields = get_all_fields(
-        source_base_url,
-        source_auth_type,
-        source_api_token,
-        source_email
-    )
-    print(f"  ✓ Retrieved {len(source_available_fields)} available fields")
-    print()
-    
     # 4. Connect to Target Jira and get all fields
     print("Step 4: Connecting to Target Jira and getting all fields...")
     target_base_url = get_base_url(target_config)
@@ -185,14 +175,28 @@ def main():
     
     print(f"  Target URL: {target_base_url}")
     print(f"  Auth Type: {target_auth_type}")
+    print()
     
-    target_available_fields = get_all_fields(
-        target_base_url,
-        target_auth_type,
-        target_api_token,
-        target_email
-    )
-    print(f"  ✓ Retrieved {len(target_available_fields)} available fields")
+    # The two field lists are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(
+            get_all_fields,
+            source_base_url,
+            source_auth_type,
+            source_api_token,
+            source_email
+        )
+        target_future = executor.submit(
+            get_all_fields,
+            target_base_url,
+            target_auth_type,
+            target_api_token,
+            target_email
+        )
+        source_available_fields = source_future.result()
+        target_available_fields = target_future.result()
+    print(f"  ✓ Retrieved {len(source_available_fields)} available Source fields")
+    print(f"  ✓ Retrieved {len(target_available_fields)} available Target fields")
     print()
     
     # 5. Validate Source fields
@@ -205,15 +209,12 @@ def main():
             source_config.get("name", "Source")
         )
         
-        print(f"  ✓ Valid fields: {len(source_valid)}")
-        if source_valid:
-            for field_id in source_valid:
-                print(f"    - {field_id}")
-        
-        print(f"  ✗ Invalid fields: {len(source_invalid)}")
-        if source_invalid:
-            for field_id in source_invalid:
-                print(f"    - {field_id} (not found)")
+        # Build the report first and print it in one write
+        lines = [f"  ✓ Valid fields: {len(source_valid)}"]
+        lines.extend(f"    - {field_id}" for field_id in source_valid)
+        lines.append(f"  ✗ Invalid fields: {len(source_invalid)}")
+        lines.extend(f"    - {field_id} (not found)" for field_id in source_invalid)
+        print("\n".join(lines))
     else:
         print("  No sourceFieldId to validate")
         source_valid = []
@@ -230,15 +231,12 @@ def main():
             target_config.get("name", "Target")
         )
         
-        print(f"  ✓ Valid fields: {len(target_valid)}")
-        if target_valid:
-            for field_id in target_valid:
-                print(f"    - {field_id}")
-        
-        print(f"  ✗ Invalid fields: {len(target_invalid)}")
-        if target_invalid:
-            for field_id in target_invalid:
-                print(f"    - {field_id} (not found)")
+        # Build the report first and print it in one write
+        lines = [f"  ✓ Valid fields: {len(target_valid)}"]
+        lines.extend(f"    - {field_id}" for field_id in target_valid)
+        lines.append(f"  ✗ Invalid fields: {len(target_invalid)}")
+        lines.extend(f"    - {field_id} (not found)" for field_id in target_invalid)
+        print("\n".join(lines))
     else:
         print("  No targetFieldId to validate")
         target_valid = []